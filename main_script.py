@@ -1,4 +1,10 @@
-import csv
+import mmap
+import os
+import pickle
+import sys
+from functools import lru_cache
+
+import numpy as np
 
 # =============================================================================
 # GDP FORECASTING MODEL FOR HAGELSLAG ISLAND (Years 101-110, revised)
@@ -35,50 +41,148 @@ import csv
 #   - Government training programs for unemployed (ages 18+)
 # =============================================================================
 
+# Columns needed from the GDP file; parsed by NumPy's C reader like the population files
+GDP_DTYPE = [('year', 'i4'), ('gdp', 'f8')]
+
+def load_gdp(path):
+    """Read a year,gdp CSV into a float64 array indexed by year (NaN for missing years)."""
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()   # small file: one read, then split in memory
+    header = lines[0].split(',')
+    usecols = [header.index(name) for name, _ in GDP_DTYPE]
+    rows = np.loadtxt(lines[1:], delimiter=',', usecols=usecols, dtype=GDP_DTYPE, ndmin=1)
+    gdp = np.full(rows['year'].max() + 1, np.nan)
+    gdp[rows['year']] = rows['gdp']
+    return gdp
+
+# Bump when a loader's return layout changes so stale sidecars are rebuilt
+CACHE_FORMAT = 10
+
+@lru_cache(maxsize=None)
+def load_cached(path, loader, *args):
+    """Return loader(path, *args), reusing a pickled sidecar while the source file is unchanged."""
+    cache_path = path + '.cache.pkl'
+    cache_key = (CACHE_FORMAT, os.path.getmtime(path), loader.__name__, args)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached[0] == cache_key:
+            return cached[1]
+    except Exception:
+        pass  # missing, truncated, stale or foreign sidecar: rebuild it
+    data = loader(path, *args)
+    # Write beside the target and rename, so an interrupted or concurrent run never leaves
+    # a partial sidecar; a read-only checkout simply runs without the cache
+    tmp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return data
+
+def year_table(tables, years, default=0):
+    """Stack {year: value} tables into a (table, year) array, filling gaps with default (None: gaps raise KeyError)."""
+    years = years.tolist()
+    if default is None:
+        return np.array([[table[y] for y in years] for table in tables], dtype=float)
+    return np.array([[table.get(y, default) for y in years] for table in tables], dtype=float)
+
+def forecast_vs_actual(forecast, actual, base_actual, years):
+    """Return (year, forecast, actual, error %, actual YoY %) rows; the first YoY is measured from base_actual."""
+    years = list(years)
+    fcasts = np.array([forecast[y] for y in years])
+    actuals = np.array([base_actual] + [actual[y] for y in years])
+    errs = (actuals[1:] - fcasts) / fcasts * 100
+    yoys = np.diff(actuals) / actuals[:-1] * 100
+    return zip(years, fcasts, actuals[1:], errs, yoys)
+
+# Row templates for forecast_vs_actual() output, bound once and shared by every post-mortem table
+# (the 111-115 and 116-120 tables are indented by two spaces)
+FVA_ROW_TEMPLATE = "{0[0]:<6}{0[1]:>14,.0f}{0[2]:>14,.0f}{0[3]:>+9.1f}%{0[4]:>+9.1f}%"
+format_fva_row = FVA_ROW_TEMPLATE.format
+format_fva_row_indented = ("  " + FVA_ROW_TEMPLATE).format
+
+def prof_row_format(n_years):
+    """Bound row template for the profession income tables: a name column, then n_years money columns."""
+    return ("{:<20}" + "{:>12,.0f}" * n_years).format
+
+# Columns needed from the population files; parsed by NumPy's C reader
+# (income stays float64: float32 totals would shift the printed figures)
+POPULATION_DTYPE = [('year', 'i4'), ('profession', 'U32'), ('income', 'f8')]
+
+def load_population(path, first_year=0, skip_professions=()):
+    """Aggregate a population CSV into per-year profession totals for years >= first_year, minus skip_professions.
+
+    The file must be sorted by year: parsing starts at the first first_year row, and falls back to the
+    whole file only when the rows after it turn out to be out of order.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError('%s is empty' % path)   # mmap cannot map a zero-length file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header = mm.readline().decode().rstrip('\r\n').split(',')
+            usecols = [header.index(name) for name, _ in POPULATION_DTYPE]
+
+            def parse(offset):
+                return np.loadtxt(mm[offset:].decode().splitlines(), delimiter=',', usecols=usecols,
+                                  dtype=POPULATION_DTYPE, ndmin=1)
+
+            # Rows are written in year order, so jump straight to the first wanted year
+            body = start = mm.tell()
+            if header[0] == 'year':
+                first_row = mm.find(b'\n%d,' % first_year, body - 1)
+                if first_row >= 0:
+                    start = first_row + 1
+            rows = parse(start)
+            if start > body and np.any(np.diff(rows['year']) < 0):
+                rows = parse(body)   # not year-sorted after all: the skipped rows may be wanted
+    rows = rows[(rows['year'] >= first_year) & ~np.isin(rows['profession'], skip_professions)]
+
+    # Profession income as a (year, profession) table; columns follow `professions`
+    professions, prof_codes = np.unique(rows['profession'], return_inverse=True)
+    profession_income = np.zeros((rows['year'].max() + 1, len(professions)))
+    np.add.at(profession_income, (rows['year'], prof_codes), rows['income'])
+
+    # Headcount per (year, profession) from one bincount over flattened cell indices
+    cells = rows['year'] * len(professions) + prof_codes
+    workforce = np.bincount(cells, minlength=profession_income.size).astype(np.int32)
+    workforce = workforce.reshape(profession_income.shape)
+
+    # Positive incomes per year as arrays (split from one year-sorted column), for percentile and Gini
+    positive = rows[rows['income'] > 0]
+    positive = positive[np.argsort(positive['year'], kind='stable')]
+    income_years, year_starts = np.unique(positive['year'], return_index=True)
+    individual_incomes = dict(zip(income_years.tolist(), np.split(positive['income'], year_starts[1:])))
+
+    # Interned so PROF lookups with literal names hit the identity fast path
+    professions = tuple(sys.intern(name) for name in professions.tolist())
+    return professions, profession_income, workforce, individual_incomes
+
 # Load GDP data
-gdp_data = {}
-with open('gdp_island', 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        gdp_data[int(row['year'])] = float(row['gdp'])
-
-# Load profession income by year from Year 110 data
-profession_income = {}
-with open('population_hage_island_year110.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        year = int(row['year'])
-        prof = row['profession']
-        income = float(row['income'])
-        if year not in profession_income:
-            profession_income[year] = {}
-        profession_income[year][prof] = profession_income[year].get(prof, 0) + income
-
-# Load population data from Year 110 data
-from collections import defaultdict
-import numpy as np
-population = defaultdict(int)
-workforce = defaultdict(lambda: defaultdict(int))
-individual_incomes = defaultdict(list)  # For percentile calculations
-with open('population_hage_island_year110.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        year = int(row['year'])
-        prof = row['profession']
-        income = float(row['income'])
-        population[year] += 1
-        workforce[year][prof] += 1
-        if income > 0:  # Only include positive incomes for percentile calc
-            individual_incomes[year].append(income)
-
-# Population statistics for Year 100
-pop_100 = population[100]
-farmers_100 = workforce[100]['farmer']
-fishers_100 = workforce[100]['fisher']
-children_100 = workforce[100]['child']
-
-# Calculate historical population growth rate (Years 95-100)
-pop_growth_rate = (population[100] - population[95]) / population[95] / 5
+gdp_data = load_cached('gdp_island', load_gdp)
+
+# Load profession income and workforce from Year 110 data
+# (parsed once, then served from population_hage_island_year110.csv.cache.pkl)
+# The Year 110 file repeats population_year105.csv row-for-row up to Year 105, so
+# this one pass covers every population year the model needs.
+# Nothing before Year 100 is referenced, and children earn nothing and are never counted
+FIRST_DATA_YEAR = 100
+SKIPPED_PROFESSIONS = ('child',)
+professions, profession_income, workforce, individual_incomes = load_cached(
+    'population_hage_island_year110.csv', load_population, FIRST_DATA_YEAR, SKIPPED_PROFESSIONS)
+PROF = {name: i for i, name in enumerate(professions)}  # profession -> profession_income column
+
+def prof_cell_or(table, year, name, default):
+    """Return table[year, PROF[name]], or default when the profession has no workers that year."""
+    col = PROF.get(name)
+    if col is None or year >= len(workforce) or not workforce[year, col]:
+        return default
+    return table[year, col]
 
 # =============================================================================
 # CALIBRATED MODEL PARAMETERS (derived from historical analysis)
@@ -133,11 +237,13 @@ TRAINING_PROGRAM_BOOST = {
 
 # Year 100 baseline values
 gdp_100 = gdp_data[100]
-fisher_100 = profession_income[100]['fisher']
-farmer_100 = profession_income[100]['farmer']
-craftsman_100 = profession_income[100]['craftsman']
-service_100 = profession_income[100]['service provider']
-civil_100 = profession_income[100]['civil servant']
+if np.isnan(gdp_100):  # load_gdp() marks years absent from the file as NaN
+    raise KeyError('gdp_island has no row for Year 100')
+fisher_100 = profession_income[100, PROF['fisher']]
+farmer_100 = profession_income[100, PROF['farmer']]
+craftsman_100 = profession_income[100, PROF['craftsman']]
+service_100 = profession_income[100, PROF['service provider']]
+civil_100 = profession_income[100, PROF['civil servant']]
 
 # =============================================================================
 # 3-YEAR FISHER INCOME CYCLE (discovered from Year 91-100 analysis)
@@ -197,123 +303,49 @@ POP_PRODUCTIVITY = {
 }
 
 # Worker counts from Year 100 (used for projections)
-fisher_count_100 = workforce[100]['fisher']
-civil_count_100 = workforce[100]['civil servant']
-
-# =============================================================================
-# YEAR 101: LOW fisher cycle + Locust damage + Civil servant decline
-# =============================================================================
-fisher_101 = FISHER_LOW_AVG * fisher_count_100
-fisher_change_101 = fisher_101 - fisher_100
-
-farmer_101 = farmer_100 * (1 + LOCUST_FARMER_DAMAGE) * (1 + WEATHER_IMPACT[101])
-locust_damage = farmer_101 - farmer_100
-
-craftsman_101 = craftsman_100 * (1 + CRAFTSMAN_GROWTH)
-craftsman_change_101 = craftsman_101 - craftsman_100
-
-service_101 = service_100 * (1 + SERVICE_GROWTH)
-service_change_101 = service_101 - service_100
-
-civil_101 = civil_100 * (1 + CIVIL_WORKFORCE_DECLINE)  # Fewer workers = less total income
-civil_change_101 = civil_101 - civil_100
-
-total_impact_101 = fisher_change_101 + locust_damage + craftsman_change_101 + service_change_101 + civil_change_101
-
-# Apply new Year 101 policies
-policy_multiplier_101 = (1 + PRESTIGE_PROJECT_BOOST[101]) * (1 + RETIREMENT_POLICY_BOOST[101]) * (1 + TRAINING_PROGRAM_BOOST[101])
-gdp_101 = (gdp_100 + total_impact_101) * POP_PRODUCTIVITY[101] * policy_multiplier_101
+fisher_count_100 = workforce[100, PROF['fisher']]
 
 # =============================================================================
-# YEAR 102: LOW fisher cycle + Farmer recovery (drought) + continued trends
+# YEARS 101-105 FORECAST (one array per profession, indexed by year - 101)
 # =============================================================================
-fisher_102 = FISHER_LOW_AVG * fisher_count_100
-fisher_change_102 = fisher_102 - fisher_101  # ~0 (both low years)
-
-farmer_102 = farmer_100 * 0.7 * (1 + WEATHER_IMPACT[102])
-farmer_recovery_102 = farmer_102 - farmer_101
+#   Fisher:     101 LOW | 102 LOW | 103 HIGH (surge) | 104 LOW | 105 LOW + flood risk
+#   Farmer:     101 locust damage | 102 70% recovery (drought) | 103 full recovery (good
+#               weather), then flat through 105
+#   Craftsman / service / civil servant compound at their trend rates from Year 100
+#   GDP:        gdp[y] = (gdp[y-1] + change in tracked profession income) x pop x policy
+YEARS_101_105 = np.arange(101, 106)
+years_out = YEARS_101_105 - 100
 
-craftsman_102 = craftsman_101 * (1 + CRAFTSMAN_GROWTH)
-craftsman_change_102 = craftsman_102 - craftsman_101
+weather, pop_productivity = year_table([WEATHER_IMPACT, POP_PRODUCTIVITY], YEARS_101_105, default=None)
+policy_boosts = year_table([PRESTIGE_PROJECT_BOOST, RETIREMENT_POLICY_BOOST, TRAINING_PROGRAM_BOOST],
+                           YEARS_101_105)
+policy_multiplier = np.prod(1 + policy_boosts, axis=0)
 
-service_102 = service_101 * (1 + SERVICE_GROWTH)
-service_change_102 = service_102 - service_101
+fisher = np.array([FISHER_LOW_AVG, FISHER_LOW_AVG, FISHER_HIGH_AVG, FISHER_LOW_AVG, FISHER_LOW_AVG]) * fisher_count_100
+fisher[4] *= 1 + weather[4]                       # Flood risk in 105
 
-civil_102 = civil_101 * (1 + CIVIL_WORKFORCE_DECLINE)
-civil_change_102 = civil_102 - civil_101
+# Locust damage / recovery and weather folded into one factor per year
+farmer_factors = np.array([1 + LOCUST_FARMER_DAMAGE, 0.7, 1.0, 1.0, 1.0]) * (1 + weather)
+farmer_factors[3:] = farmer_factors[2]            # No further farmer change after 103
+farmer = farmer_100 * farmer_factors
 
-# Apply Year 102 policies
-policy_multiplier_102 = (1 + PRESTIGE_PROJECT_BOOST[102]) * (1 + RETIREMENT_POLICY_BOOST[102]) * (1 + TRAINING_PROGRAM_BOOST[102])
-gdp_102 = (gdp_101 + farmer_recovery_102 + fisher_change_102 + craftsman_change_102 + service_change_102 + civil_change_102) * POP_PRODUCTIVITY[102] * policy_multiplier_102
+craftsman = craftsman_100 * (1 + CRAFTSMAN_GROWTH) ** years_out
+service = service_100 * (1 + SERVICE_GROWTH) ** years_out
+civil = civil_100 * (1 + CIVIL_WORKFORCE_DECLINE) ** years_out  # Fewer workers = less total income
 
-# =============================================================================
-# YEAR 103: HIGH fisher cycle (SURGE!) + Full farmer recovery + good weather
-# =============================================================================
-fisher_103 = FISHER_HIGH_AVG * fisher_count_100
-fisher_surge_103 = fisher_103 - fisher_102  # Big jump from low to high
-
-farmer_103 = farmer_100 * (1 + WEATHER_IMPACT[103])
-farmer_recovery_103 = farmer_103 - farmer_102
-
-craftsman_103 = craftsman_102 * (1 + CRAFTSMAN_GROWTH)
-craftsman_change_103 = craftsman_103 - craftsman_102
-
-service_103 = service_102 * (1 + SERVICE_GROWTH)
-service_change_103 = service_103 - service_102
-
-civil_103 = civil_102 * (1 + CIVIL_WORKFORCE_DECLINE)
-civil_change_103 = civil_103 - civil_102
-
-# Apply Year 103 policies
-policy_multiplier_103 = (1 + PRESTIGE_PROJECT_BOOST[103]) * (1 + RETIREMENT_POLICY_BOOST[103]) * (1 + TRAINING_PROGRAM_BOOST[103])
-gdp_103 = (gdp_102 + farmer_recovery_103 + fisher_surge_103 + craftsman_change_103 + service_change_103 + civil_change_103) * POP_PRODUCTIVITY[103] * policy_multiplier_103
-
-# =============================================================================
-# YEAR 104: LOW fisher cycle + normal conditions
-# =============================================================================
-fisher_104 = FISHER_LOW_AVG * fisher_count_100
-fisher_change_104 = fisher_104 - fisher_103  # Drop from high to low
-
-craftsman_104 = craftsman_103 * (1 + CRAFTSMAN_GROWTH)
-craftsman_change_104 = craftsman_104 - craftsman_103
-
-service_104 = service_103 * (1 + SERVICE_GROWTH)
-service_change_104 = service_104 - service_103
-
-civil_104 = civil_103 * (1 + CIVIL_WORKFORCE_DECLINE)
-civil_change_104 = civil_104 - civil_103
-
-# Apply Year 104 policies
-policy_multiplier_104 = (1 + PRESTIGE_PROJECT_BOOST[104]) * (1 + RETIREMENT_POLICY_BOOST[104]) * (1 + TRAINING_PROGRAM_BOOST[104])
-gdp_104 = (gdp_103 + fisher_change_104 + craftsman_change_104 + service_change_104 + civil_change_104) * POP_PRODUCTIVITY[104] * policy_multiplier_104
-
-# =============================================================================
-# YEAR 105: LOW fisher cycle + flood risk
-# =============================================================================
-fisher_105 = FISHER_LOW_AVG * fisher_count_100 * (1 + WEATHER_IMPACT[105])
-fisher_change_105 = fisher_105 - fisher_104  # ~0 (both low years)
+# Year-on-year change in total tracked income (Year 100 actuals as the starting point)
+tracked = np.vstack([fisher, farmer, craftsman, service, civil])
+tracked_100 = np.array([[fisher_100], [farmer_100], [craftsman_100], [service_100], [civil_100]])
+total_impact = np.diff(np.hstack([tracked_100, tracked]), axis=1).sum(axis=0)
 
-craftsman_105 = craftsman_104 * (1 + CRAFTSMAN_GROWTH)
-craftsman_change_105 = craftsman_105 - craftsman_104
-
-service_105 = service_104 * (1 + SERVICE_GROWTH)
-service_change_105 = service_105 - service_104
-
-civil_105 = civil_104 * (1 + CIVIL_WORKFORCE_DECLINE)
-civil_change_105 = civil_105 - civil_104
-
-# Apply Year 105 policies
-policy_multiplier_105 = (1 + PRESTIGE_PROJECT_BOOST[105]) * (1 + RETIREMENT_POLICY_BOOST[105]) * (1 + TRAINING_PROGRAM_BOOST[105])
-gdp_105 = (gdp_104 + fisher_change_105 + craftsman_change_105 + service_change_105 + civil_change_105) * POP_PRODUCTIVITY[105] * policy_multiplier_105
+# The GDP recurrence is first-order linear, so with growth = cumprod(pop x policy) it
+# unrolls to gdp[k] = growth[k] * (gdp_100 + sum_{j<=k} impact[j] / growth[j-1])
+growth = np.cumprod(pop_productivity * policy_multiplier)
+growth_before = np.concatenate(([1.0], growth[:-1]))
+gdp_101_105 = growth * (gdp_100 + np.cumsum(total_impact / growth_before))
 
 # Store forecasts
-forecasts = {
-    101: gdp_101,
-    102: gdp_102,
-    103: gdp_103,
-    104: gdp_104,
-    105: gdp_105
-}
+forecasts = dict(zip(YEARS_101_105.tolist(), gdp_101_105.tolist()))
 
 # =============================================================================
 # POST-MORTEM: FORECAST VS ACTUAL (Years 101-105)
@@ -389,6 +421,7 @@ RETIRED_PROJ = {106: 22000, 107: 24000, 108: 27000, 109: 30000, 110: 33000}
 
 # Homemaker + Unemployed: net-cost category, combined costs trending ~5%/yr
 HOME_UNEMP_GROWTH = 0.05
+HOME_UNEMP_MULT = 1 + HOME_UNEMP_GROWTH
 
 # =============================================================================
 # NEW POLICIES ENACTED IN YEAR 106
@@ -428,17 +461,17 @@ ENTRANT_GROWTH      = 0.012   # avg of craftsman/service/civil/farmer growth rat
 PRESTIGE_106_BOOST = {107: 0.008, 108: 0.015, 109: 0.022, 110: 0.028}
 
 # =============================================================================
-# YEAR 105 ACTUALS (all professions, loaded from population_year105.csv)
+# YEAR 105 ACTUALS (all professions, from the Year 110 population file)
 # =============================================================================
-fisher_105_est     = profession_income[105]['fisher']            # 323,155  HIGH year
-farmer_105_est     = profession_income[105]['farmer']            # 174,107
-craftsman_105_est  = profession_income[105]['craftsman']         # 253,394
-service_105_est    = profession_income[105]['service provider']  # 225,830
-civil_105_est      = profession_income[105]['civil servant']     # 185,584
-retired_105_est    = profession_income[105]['retired']           #  27,599
-homemaker_105_est  = profession_income[105]['homemaker']         # -16,805
-unemployed_105_est = profession_income[105]['unemployed']        #  -4,427
-fisher_count_105   = workforce[105]['fisher']                    # 78
+fisher_105_est     = profession_income[105, PROF['fisher']]            # 323,155  HIGH year
+farmer_105_est     = profession_income[105, PROF['farmer']]            # 174,107
+craftsman_105_est  = profession_income[105, PROF['craftsman']]         # 253,394
+service_105_est    = profession_income[105, PROF['service provider']]  # 225,830
+civil_105_est      = profession_income[105, PROF['civil servant']]     # 185,584
+retired_105_est    = profession_income[105, PROF['retired']]           #  27,599
+homemaker_105_est  = profession_income[105, PROF['homemaker']]         # -16,805
+unemployed_105_est = profession_income[105, PROF['unemployed']]        #  -4,427
+fisher_count_105   = workforce[105, PROF['fisher']]                    # 78
 
 POP_PRODUCTIVITY_NEW = {106: 1.002, 107: 1.002, 108: 1.001, 109: 1.001, 110: 1.001}
 
@@ -457,212 +490,124 @@ POP_PRODUCTIVITY_NEW = {106: 1.002, 107: 1.002, 108: 1.001, 109: 1.001, 110: 1.0
 #   (C) Homemaker exit → cumulative new-entrant income tracked per year
 # =============================================================================
 
-# --- Separate baselines (Year 105 actuals) ---
-hm_count_prev  = workforce[105]['homemaker']   # homemaker headcount in 105
-hm_income_prev = homemaker_105_est             # total homemaker income 105 (negative)
-unemp_prev     = unemployed_105_est            # total unemployed income 105 (negative)
-cum_entrant_inc = 0.0                          # cumulative new-entrant income (grows + adds)
-
-# ── Year 106: Fisher LOW ──
-hm_leaving     = hm_count_prev * HOMEMAKER_EXIT_RATE
-hm_count_106   = hm_count_prev - hm_leaving
-hm_income_106  = hm_income_prev * (1 + HOME_UNEMP_GROWTH) * (hm_count_106 / hm_count_prev)
-unemp_106      = unemp_prev     * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_inc = cum_entrant_inc * (1 + ENTRANT_GROWTH) + hm_leaving * NEW_ENTRANT_INCOME
-
-fisher_106     = FISHER_LOW_AVG_R  * fisher_count_105
-craftsman_106  = craftsman_105_est * (1 + CRAFTSMAN_GROWTH_R)
-service_106    = service_105_est   * (1 + SERVICE_GROWTH_R)
-civil_106      = civil_105_est     * (1 + CIVIL_SERVANT_GROWTH_R)
-farmer_106     = farmer_105_est    * (1 + FARMER_GROWTH_R)
-retired_106    = RETIRED_PROJ[106]
-
-prof_sum_106   = (fisher_106 + craftsman_106 + service_106 + civil_106 + farmer_106
-                  + retired_106 + hm_income_106 + unemp_106 + cum_entrant_inc)
-policy_106     = ((1 + PRESTIGE_101_CARRYOVER.get(106, 0))
-                  * (1 + WIND_TRANSITION_DRAG)
-                  * (1 + WIND_DISPLEASURE_DRAG.get(106, 0))
-                  * (1 + PRESTIGE_106_BOOST.get(106, 0)))
-gdp_106        = prof_sum_106 * POP_PRODUCTIVITY_NEW[106] * policy_106
-
-# snapshots for output
-cum_ent_106 = cum_entrant_inc; hm_cnt_106 = hm_count_106; hm_lv_106 = hm_leaving
-
-# ── Year 107: Fisher LOW  (sturgeon surge — income realised 108) ──
-hm_leaving     = hm_count_106  * HOMEMAKER_EXIT_RATE
-hm_count_107   = hm_count_106  - hm_leaving
-hm_income_107  = hm_income_106 * (1 + HOME_UNEMP_GROWTH) * (hm_count_107 / hm_count_106)
-unemp_107      = unemp_106     * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_inc = cum_entrant_inc * (1 + ENTRANT_GROWTH) + hm_leaving * NEW_ENTRANT_INCOME
-
-fisher_107     = FISHER_LOW_AVG_R  * fisher_count_105
-craftsman_107  = craftsman_106  * (1 + CRAFTSMAN_GROWTH_R)
-service_107    = service_106    * (1 + SERVICE_GROWTH_R)
-civil_107      = civil_106      * (1 + CIVIL_SERVANT_GROWTH_R)
-farmer_107     = farmer_106     * (1 + FARMER_GROWTH_R)
-retired_107    = RETIRED_PROJ[107]
-
-prof_sum_107   = (fisher_107 + craftsman_107 + service_107 + civil_107 + farmer_107
-                  + retired_107 + hm_income_107 + unemp_107 + cum_entrant_inc)
-policy_107     = ((1 + PRESTIGE_101_CARRYOVER.get(107, 0))
-                  * (1 + WIND_TRANSITION_DRAG)
-                  * (1 + WIND_DISPLEASURE_DRAG.get(107, 0))
-                  * (1 + PRESTIGE_106_BOOST.get(107, 0)))
-gdp_107        = prof_sum_107 * POP_PRODUCTIVITY_NEW[107] * policy_107
-
-cum_ent_107 = cum_entrant_inc; hm_cnt_107 = hm_count_107; hm_lv_107 = hm_leaving
-
-# ── Year 108: Fisher HIGH  (surge was in 107) ──
-hm_leaving     = hm_count_107  * HOMEMAKER_EXIT_RATE
-hm_count_108   = hm_count_107  - hm_leaving
-hm_income_108  = hm_income_107 * (1 + HOME_UNEMP_GROWTH) * (hm_count_108 / hm_count_107)
-unemp_108      = unemp_107     * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_inc = cum_entrant_inc * (1 + ENTRANT_GROWTH) + hm_leaving * NEW_ENTRANT_INCOME
-
-fisher_108     = FISHER_HIGH_AVG_R * fisher_count_105
-craftsman_108  = craftsman_107  * (1 + CRAFTSMAN_GROWTH_R)
-service_108    = service_107    * (1 + SERVICE_GROWTH_R)
-civil_108      = civil_107      * (1 + CIVIL_SERVANT_GROWTH_R)
-farmer_108     = farmer_107     * (1 + FARMER_GROWTH_R)
-retired_108    = RETIRED_PROJ[108]
-
-prof_sum_108   = (fisher_108 + craftsman_108 + service_108 + civil_108 + farmer_108
-                  + retired_108 + hm_income_108 + unemp_108 + cum_entrant_inc)
-policy_108     = ((1 + PRESTIGE_101_CARRYOVER.get(108, 0))
-                  * (1 + WIND_TRANSITION_DRAG)
-                  * (1 + WIND_DISPLEASURE_DRAG.get(108, 0))
-                  * (1 + PRESTIGE_106_BOOST.get(108, 0)))
-gdp_108        = prof_sum_108 * POP_PRODUCTIVITY_NEW[108] * policy_108
-
-cum_ent_108 = cum_entrant_inc; hm_cnt_108 = hm_count_108; hm_lv_108 = hm_leaving
-
-# ── Year 109: Fisher LOW ──
-hm_leaving     = hm_count_108  * HOMEMAKER_EXIT_RATE
-hm_count_109   = hm_count_108  - hm_leaving
-hm_income_109  = hm_income_108 * (1 + HOME_UNEMP_GROWTH) * (hm_count_109 / hm_count_108)
-unemp_109      = unemp_108     * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_inc = cum_entrant_inc * (1 + ENTRANT_GROWTH) + hm_leaving * NEW_ENTRANT_INCOME
-
-fisher_109     = FISHER_LOW_AVG_R  * fisher_count_105
-craftsman_109  = craftsman_108  * (1 + CRAFTSMAN_GROWTH_R)
-service_109    = service_108    * (1 + SERVICE_GROWTH_R)
-civil_109      = civil_108      * (1 + CIVIL_SERVANT_GROWTH_R)
-farmer_109     = farmer_108     * (1 + FARMER_GROWTH_R)
-retired_109    = RETIRED_PROJ[109]
-
-prof_sum_109   = (fisher_109 + craftsman_109 + service_109 + civil_109 + farmer_109
-                  + retired_109 + hm_income_109 + unemp_109 + cum_entrant_inc)
-policy_109     = ((1 + PRESTIGE_101_CARRYOVER.get(109, 0))
-                  * (1 + WIND_TRANSITION_DRAG)
-                  * (1 + WIND_DISPLEASURE_DRAG.get(109, 0))
-                  * (1 + PRESTIGE_106_BOOST.get(109, 0)))
-gdp_109        = prof_sum_109 * POP_PRODUCTIVITY_NEW[109] * policy_109
-
-cum_ent_109 = cum_entrant_inc; hm_cnt_109 = hm_count_109; hm_lv_109 = hm_leaving
-
-# ── Year 110: Fisher LOW  (sturgeon surge — income realised 111) ──
-hm_leaving     = hm_count_109  * HOMEMAKER_EXIT_RATE
-hm_count_110   = hm_count_109  - hm_leaving
-hm_income_110  = hm_income_109 * (1 + HOME_UNEMP_GROWTH) * (hm_count_110 / hm_count_109)
-unemp_110      = unemp_109     * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_inc = cum_entrant_inc * (1 + ENTRANT_GROWTH) + hm_leaving * NEW_ENTRANT_INCOME
-
-fisher_110     = FISHER_LOW_AVG_R  * fisher_count_105
-craftsman_110  = craftsman_109  * (1 + CRAFTSMAN_GROWTH_R)
-service_110    = service_109    * (1 + SERVICE_GROWTH_R)
-civil_110      = civil_109      * (1 + CIVIL_SERVANT_GROWTH_R)
-farmer_110     = farmer_109     * (1 + FARMER_GROWTH_R)
-retired_110    = RETIRED_PROJ[110]
-
-prof_sum_110   = (fisher_110 + craftsman_110 + service_110 + civil_110 + farmer_110
-                  + retired_110 + hm_income_110 + unemp_110 + cum_entrant_inc)
-policy_110     = ((1 + PRESTIGE_101_CARRYOVER.get(110, 0))
-                  * (1 + WIND_TRANSITION_DRAG)
-                  * (1 + WIND_DISPLEASURE_DRAG.get(110, 0))
-                  * (1 + PRESTIGE_106_BOOST.get(110, 0)))
-gdp_110        = prof_sum_110 * POP_PRODUCTIVITY_NEW[110] * policy_110
-
-cum_ent_110 = cum_entrant_inc; hm_cnt_110 = hm_count_110; hm_lv_110 = hm_leaving
-
-new_forecasts = {106: gdp_106, 107: gdp_107, 108: gdp_108, 109: gdp_109, 110: gdp_110}
+# --- Compounded growth series (Year 105 actual at index 0, indexed by year - 105) ---
+years_past_105   = np.arange(6)
+craftsman_series = craftsman_105_est * (1 + CRAFTSMAN_GROWTH_R) ** years_past_105
+service_series   = service_105_est   * (1 + SERVICE_GROWTH_R) ** years_past_105
+civil_series     = civil_105_est     * (1 + CIVIL_SERVANT_GROWTH_R) ** years_past_105
+farmer_series    = farmer_105_est    * (1 + FARMER_GROWTH_R) ** years_past_105
+
+YEARS_106_110 = np.arange(106, 111)
+
+# --- Fisher cycle and retired projection (one entry per year) ---
+fisher_106_110  = np.array([FISHER_LOW_AVG_R, FISHER_LOW_AVG_R, FISHER_HIGH_AVG_R,
+                            FISHER_LOW_AVG_R, FISHER_LOW_AVG_R]) * fisher_count_105
+retired_106_110 = np.array([RETIRED_PROJ[y] for y in YEARS_106_110])
+
+# --- Homemaker exit (C): closed-form per-year path, shared with the 111-116 block ---
+def homemaker_exit_path(hm_count, hm_income, unemp, cum_entrant, n_years):
+    """Project the homemaker / unemployed / new-entrant state n_years forward; rows are
+    (count, leaving, homemaker income, unemployed income, cumulative entrant income)."""
+    k = np.arange(1, n_years + 1)
+    stay = (1 - HOMEMAKER_EXIT_RATE) ** k               # share of the starting homemakers left
+    count = hm_count * stay
+    leaving = hm_count * HOMEMAKER_EXIT_RATE * (1 - HOMEMAKER_EXIT_RATE) ** (k - 1)
+    # Income per homemaker grows with HOME_UNEMP_GROWTH, so the headcount ratio is just `stay`
+    income = hm_income * HOME_UNEMP_MULT ** k * stay
+    unemp = unemp * HOME_UNEMP_MULT ** k
+    # cum[k] = cum[k-1] * (1 + ENTRANT_GROWTH) + leaving[k] * NEW_ENTRANT_INCOME, unrolled as
+    # cum[k] = growth[k] * (cum_entrant + sum_{j<=k} leaving[j] * NEW_ENTRANT_INCOME / growth[j])
+    growth = (1 + ENTRANT_GROWTH) ** k
+    cum = growth * (cum_entrant + np.cumsum(leaving * NEW_ENTRANT_INCOME / growth))
+    return np.vstack([count, leaving, income, unemp, cum])
+
+hm_count_106_110, hm_leaving_106_110, hm_income_106_110, unemp_106_110, cum_ent_106_110 = homemaker_exit_path(
+    workforce[105, PROF['homemaker']],   # homemaker headcount in 105
+    homemaker_105_est,                   # total homemaker income 105 (negative)
+    unemployed_105_est,                  # total unemployed income 105 (negative)
+    0.0,                                 # cumulative new-entrant income (grows + adds)
+    len(YEARS_106_110))
+cum_entrant_inc = cum_ent_106_110[-1]    # carried into the Year 111 forecast
+
+# --- Profession sum, GDP-level policies and GDP ---
+income_106_110   = np.vstack([fisher_106_110, craftsman_series[1:], service_series[1:], civil_series[1:],
+                              farmer_series[1:], retired_106_110, hm_income_106_110, unemp_106_110,
+                              cum_ent_106_110])   # one row per income source, one column per year
+prof_sum_106_110 = income_106_110.sum(axis=0)
+policy_boosts_106_110 = year_table([PRESTIGE_101_CARRYOVER,
+                                    dict.fromkeys(YEARS_106_110.tolist(), WIND_TRANSITION_DRAG),
+                                    WIND_DISPLEASURE_DRAG, PRESTIGE_106_BOOST], YEARS_106_110)
+policy_106_110   = np.prod(1 + policy_boosts_106_110, axis=0)
+gdp_106_110      = prof_sum_106_110 * year_table([POP_PRODUCTIVITY_NEW], YEARS_106_110, default=None)[0] * policy_106_110
+
+new_forecasts = dict(zip(YEARS_106_110.tolist(), gdp_106_110.tolist()))
+policy_mults  = dict(zip(YEARS_106_110.tolist(), policy_106_110.tolist()))
 
 # =============================================================================
 # OUTPUT
 # =============================================================================
-print("=" * 70)
-print("GDP FORECAST FOR HAGELSLAG ISLAND — REVISED MODEL")
-print("=" * 70)
-
-print("\nModel Parameters (recalibrated from 100-105 actuals):")
-print(f"  Fisher 3-yr cycle:         HIGH=${FISHER_HIGH_AVG_R:,.0f}, LOW=${FISHER_LOW_AVG_R:,.0f}")
-print(f"  Sturgeon cycle:            Phase-shifted — surges 101,104,107,110")
-print(f"  Locust damage (revised):   {LOCUST_FARMER_DAMAGE_REVISED*100:.1f}% peak (2-yr lag)")
-print(f"  Craftsman total growth:    +{CRAFTSMAN_GROWTH_R*100:.1f}% annual")
-print(f"  Service total growth:      +{SERVICE_GROWTH_R*100:.1f}% annual")
-print(f"  Civil servant growth:      +{CIVIL_SERVANT_GROWTH_R*100:.1f}% annual (workforce grew)")
-print(f"  Farmer total growth:       +{FARMER_GROWTH_R*100:.1f}% annual (post-recovery)")
-print(f"  Retired income (proj):     ${RETIRED_PROJ[106]:,} → ${RETIRED_PROJ[110]:,} (recovering)")
-
-print("\nPolicies (Year 101, sustained):")
-print(f"  Prestige Project:          Construction complete; benefits continue")
-print(f"  Retirement Age:            {OLD_RETIREMENT_AGE} → {NEW_RETIREMENT_AGE} (adoption ongoing)")
-print(f"  Training Programs (18+):   Mature, sustained")
-
-print("\nPolicies (Year 106, new):")
-print(f"  Prestige-101 carry-over:   +2.5 % GDP in Year 106 (residual from 101 project)")
-print(f"  Wind Energy Transition:    −3.0 % GDP p.a. Years 106-110; permanent ↓ emissions")
-print(f"  Resident Displeasure:      −0.5…−1.5 % GDP Years 106-110; tourism & morale drag")
-print(f"  Dual-Income Incentive:     2 %/yr homemakers → workforce (Years 106-110)")
-print(f"  Prestige Project 2:        Enacted 106; +0.8…+2.8 % ramp Years 107-110 (+3.0 % in 111)")
+# Report lines are collected here and written in one go at the end of the script
+out = []
+out.append("=" * 70)
+out.append("GDP FORECAST FOR HAGELSLAG ISLAND — REVISED MODEL")
+out.append("=" * 70)
+
+out.append("\nModel Parameters (recalibrated from 100-105 actuals):")
+out.append(f"  Fisher 3-yr cycle:         HIGH=${FISHER_HIGH_AVG_R:,.0f}, LOW=${FISHER_LOW_AVG_R:,.0f}")
+out.append(f"  Sturgeon cycle:            Phase-shifted — surges 101,104,107,110")
+out.append(f"  Locust damage (revised):   {LOCUST_FARMER_DAMAGE_REVISED*100:.1f}% peak (2-yr lag)")
+out.append(f"  Craftsman total growth:    +{CRAFTSMAN_GROWTH_R*100:.1f}% annual")
+out.append(f"  Service total growth:      +{SERVICE_GROWTH_R*100:.1f}% annual")
+out.append(f"  Civil servant growth:      +{CIVIL_SERVANT_GROWTH_R*100:.1f}% annual (workforce grew)")
+out.append(f"  Farmer total growth:       +{FARMER_GROWTH_R*100:.1f}% annual (post-recovery)")
+out.append(f"  Retired income (proj):     ${RETIRED_PROJ[106]:,} → ${RETIRED_PROJ[110]:,} (recovering)")
+
+out.append("\nPolicies (Year 101, sustained):")
+out.append(f"  Prestige Project:          Construction complete; benefits continue")
+out.append(f"  Retirement Age:            {OLD_RETIREMENT_AGE} → {NEW_RETIREMENT_AGE} (adoption ongoing)")
+out.append(f"  Training Programs (18+):   Mature, sustained")
+
+out.append("\nPolicies (Year 106, new):")
+out.append(f"  Prestige-101 carry-over:   +2.5 % GDP in Year 106 (residual from 101 project)")
+out.append(f"  Wind Energy Transition:    −3.0 % GDP p.a. Years 106-110; permanent ↓ emissions")
+out.append(f"  Resident Displeasure:      −0.5…−1.5 % GDP Years 106-110; tourism & morale drag")
+out.append(f"  Dual-Income Incentive:     2 %/yr homemakers → workforce (Years 106-110)")
+out.append(f"  Prestige Project 2:        Enacted 106; +0.8…+2.8 % ramp Years 107-110 (+3.0 % in 111)")
 
 # --- 101-105 comparison ---
-print("\n" + "=" * 70)
-print("YEARS 101-105: FORECAST vs ACTUAL")
-print("=" * 70)
-print(f"{'Year':<6}{'Forecast':>14}{'Actual':>14}{'Fcst Err':>10}{'Act YoY':>10}")
-print("-" * 70)
-
-prev_actual = gdp_100
-for year in range(101, 106):
-    fcast = forecasts[year]
-    actual = ACTUAL_GDP[year]
-    err = ((actual - fcast) / fcast) * 100
-    yoy = ((actual - prev_actual) / prev_actual) * 100
-    print(f"{year:<6}{fcast:>14,.0f}{actual:>14,.0f}{err:>+9.1f}%{yoy:>+9.1f}%")
-    prev_actual = actual
-
-print("-" * 70)
-print("  101: Locust partial impact (-18% farmer); fisher LOW as forecast")
-print("  102: Farmer CRASHED -82% (peak locust damage); fisher unexpectedly HIGH")
-print("  103: Farmer still crushed; fisher LOW (cycle phase opposite of forecast)")
-print("  104-105: Farmer recovery + policies drove ~15% annual growth")
+out.append("\n" + "=" * 70)
+out.append("YEARS 101-105: FORECAST vs ACTUAL")
+out.append("=" * 70)
+out.append(f"{'Year':<6}{'Forecast':>14}{'Actual':>14}{'Fcst Err':>10}{'Act YoY':>10}")
+out.append("-" * 70)
+
+out.extend(map(format_fva_row, forecast_vs_actual(forecasts, ACTUAL_GDP, gdp_100, range(101, 106))))
+
+out.append("-" * 70)
+out.append("  101: Locust partial impact (-18% farmer); fisher LOW as forecast")
+out.append("  102: Farmer CRASHED -82% (peak locust damage); fisher unexpectedly HIGH")
+out.append("  103: Farmer still crushed; fisher LOW (cycle phase opposite of forecast)")
+out.append("  104-105: Farmer recovery + policies drove ~15% annual growth")
 
 # --- profession-level actuals (Years 100-105) ---
-print("\n" + "=" * 70)
-print("YEARS 100-105: PROFESSION TOTAL INCOME (actuals)")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("YEARS 100-105: PROFESSION TOTAL INCOME (actuals)")
+out.append("=" * 70)
 prof_keys = ['farmer', 'fisher', 'craftsman', 'service provider', 'civil servant',
              'retired', 'homemaker', 'unemployed']
-print(f"{'Profession':<20}", end="")
-for y in range(100, 106):
-    print(f"{y:>12}", end="")
-print()
-print("-" * 92)
-for prof in prof_keys:
-    print(f"{prof:<20}", end="")
-    for y in range(100, 106):
-        print(f"{profession_income[y].get(prof, 0):>12,.0f}", end="")
-    print()
-print("-" * 92)
-print(f"{'TOTAL GDP':<20}", end="")
-for y in range(100, 106):
-    print(f"{sum(profession_income[y].values()):>12,.0f}", end="")
-print()
-
+format_prof_row_6 = prof_row_format(6)   # shared with the 105-110 table below
+out.append(f"{'Profession':<20}" + "".join(f"{y:>12}" for y in range(100, 106)))
+out.append("-" * 92)
+# (profession, year) slice in prof_keys order, so each table row is one array row
+actuals_100_105 = profession_income[100:106, [PROF[prof] for prof in prof_keys]].T
+for prof, row in zip(prof_keys, actuals_100_105.tolist()):
+    out.append(format_prof_row_6(prof, *row))
+out.append("-" * 92)
+out.append(format_prof_row_6('TOTAL GDP', *profession_income[100:106].sum(axis=1).tolist()))
 # --- 106-110 forecast ---
-print("\n" + "=" * 70)
-print("YEARS 106-110: REVISED FORECAST (Year 106 policies active)")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("YEARS 106-110: REVISED FORECAST (Year 106 policies active)")
+out.append("=" * 70)
 
 notes_106_110 = {
     106: "Fisher LOW; Prestige-101 +2.5 %; Wind −3.0 %; Displeasure −0.5 %",
@@ -672,158 +617,102 @@ notes_106_110 = {
     110: "Fisher LOW; Surge event; Wind −3.0 %; Displeasure −1.0 %; Prestige-106 +2.8 %"
 }
 
-policy_mults = {106: policy_106, 107: policy_107, 108: policy_108, 109: policy_109, 110: policy_110}
-
-print(f"{'Year':<6}{'GDP':>15}{'YoY Chg':>10}{'Policy×':>10}  Notes")
-print("-" * 78)
-print(f"{'105':<6}{ACTUAL_GDP[105]:>15,.2f}{'':>10}{'1.0000':>10}  Actual (baseline)")
+out.append(f"{'Year':<6}{'GDP':>15}{'YoY Chg':>10}{'Policy×':>10}  Notes")
+out.append("-" * 78)
+out.append(f"{'105':<6}{ACTUAL_GDP[105]:>15,.2f}{'':>10}{'1.0000':>10}  Actual (baseline)")
 
-prev = ACTUAL_GDP[105]
-for year in range(106, 111):
-    gdp  = new_forecasts[year]
-    chg  = ((gdp - prev) / prev) * 100
+gdps = np.array([ACTUAL_GDP[105]] + [new_forecasts[y] for y in range(106, 111)])
+chgs = np.diff(gdps) / gdps[:-1] * 100
+for year, gdp, chg in zip(range(106, 111), gdps[1:], chgs):
     pm   = policy_mults[year]
-    print(f"{year:<6}{gdp:>15,.2f}{chg:>+9.1f}%{pm:>10.4f}  {notes_106_110[year]}")
-    prev = gdp
+    out.append(f"{year:<6}{gdp:>15,.2f}{chg:>+9.1f}%{pm:>10.4f}  {notes_106_110[year]}")
 
 # --- profession-level forecasts 105-110 ---
-print("\n" + "=" * 70)
-print("YEARS 105-110: PROFESSION TOTAL INCOME (105 actual / 106-110 forecast)")
-print("=" * 70)
-
-forecast_profs = {
-    105: {'fisher': fisher_105_est, 'farmer': farmer_105_est, 'craftsman': craftsman_105_est,
-          'service provider': service_105_est, 'civil servant': civil_105_est,
-          'retired': retired_105_est, 'homemaker': homemaker_105_est,
-          'unemployed': unemployed_105_est, 'new entrants': 0},
-    106: {'fisher': fisher_106, 'farmer': farmer_106, 'craftsman': craftsman_106,
-          'service provider': service_106, 'civil servant': civil_106,
-          'retired': retired_106, 'homemaker': hm_income_106,
-          'unemployed': unemp_106, 'new entrants': cum_ent_106},
-    107: {'fisher': fisher_107, 'farmer': farmer_107, 'craftsman': craftsman_107,
-          'service provider': service_107, 'civil servant': civil_107,
-          'retired': retired_107, 'homemaker': hm_income_107,
-          'unemployed': unemp_107, 'new entrants': cum_ent_107},
-    108: {'fisher': fisher_108, 'farmer': farmer_108, 'craftsman': craftsman_108,
-          'service provider': service_108, 'civil servant': civil_108,
-          'retired': retired_108, 'homemaker': hm_income_108,
-          'unemployed': unemp_108, 'new entrants': cum_ent_108},
-    109: {'fisher': fisher_109, 'farmer': farmer_109, 'craftsman': craftsman_109,
-          'service provider': service_109, 'civil servant': civil_109,
-          'retired': retired_109, 'homemaker': hm_income_109,
-          'unemployed': unemp_109, 'new entrants': cum_ent_109},
-    110: {'fisher': fisher_110, 'farmer': farmer_110, 'craftsman': craftsman_110,
-          'service provider': service_110, 'civil servant': civil_110,
-          'retired': retired_110, 'homemaker': hm_income_110,
-          'unemployed': unemp_110, 'new entrants': cum_ent_110},
-}
+out.append("\n" + "=" * 70)
+out.append("YEARS 105-110: PROFESSION TOTAL INCOME (105 actual / 106-110 forecast)")
+out.append("=" * 70)
 
 prof_order = ['fisher', 'farmer', 'craftsman', 'service provider', 'civil servant',
               'retired', 'homemaker', 'unemployed', 'new entrants']
-print(f"{'Profession':<20}", end="")
-for y in range(105, 111):
-    print(f"{y:>12}", end="")
-print()
-print("-" * 92)
-for prof in prof_order:
-    print(f"{prof:<20}", end="")
-    for y in range(105, 111):
-        print(f"{forecast_profs[y].get(prof, 0):>12,.0f}", end="")
-    print()
-print("-" * 92)
-print(f"{'Prof subtotal':<20}", end="")
-for y in range(105, 111):
-    print(f"{sum(forecast_profs[y].values()):>12,.0f}", end="")
-print()
+# One row per profession (prof_order), one column per year 105..110
+forecast_profs = np.column_stack([
+    [fisher_105_est, farmer_105_est, craftsman_105_est, service_105_est, civil_105_est,
+     retired_105_est, homemaker_105_est, unemployed_105_est, 0],
+    np.vstack([fisher_106_110, farmer_series[1:], craftsman_series[1:], service_series[1:], civil_series[1:],
+               retired_106_110, hm_income_106_110, unemp_106_110, cum_ent_106_110]),
+])
+out.append(f"{'Profession':<20}" + "".join(f"{y:>12}" for y in range(105, 111)))
+out.append("-" * 92)
+for prof, row in zip(prof_order, forecast_profs.tolist()):
+    out.append(format_prof_row_6(prof, *row))
+out.append("-" * 92)
+out.append(format_prof_row_6('Prof subtotal', *forecast_profs.sum(axis=0).tolist()))
 
 # --- policy multiplier breakdown ---
-print("\n" + "=" * 70)
-print("POLICY MULTIPLIER BREAKDOWN (Years 106-110)")
-print("=" * 70)
-print(f"{'Year':<6}{'Prestige-101':>14}{'Wind Drag':>12}{'Displeasure':>13}{'Prestige-106':>14}{'Combined':>12}")
-print("-" * 73)
-for y in range(106, 111):
-    p101  = PRESTIGE_101_CARRYOVER.get(y, 0.0)
-    wind  = WIND_TRANSITION_DRAG
-    disp  = WIND_DISPLEASURE_DRAG.get(y, 0.0)
-    p106  = PRESTIGE_106_BOOST.get(y, 0.0)
-    combo = (1 + p101) * (1 + wind) * (1 + disp) * (1 + p106)
-    print(f"{y:<6}{p101:>+13.1%}{wind:>+11.1%}{disp:>+12.1%}{p106:>+13.1%}{combo:>+11.2%}")
+out.append("\n" + "=" * 70)
+out.append("POLICY MULTIPLIER BREAKDOWN (Years 106-110)")
+out.append("=" * 70)
+out.append(f"{'Year':<6}{'Prestige-101':>14}{'Wind Drag':>12}{'Displeasure':>13}{'Prestige-106':>14}{'Combined':>12}")
+out.append("-" * 73)
+for y, (p101, wind, disp, p106), combo in zip(YEARS_106_110.tolist(), policy_boosts_106_110.T.tolist(),
+                                             policy_106_110.tolist()):
+    out.append(f"{y:<6}{p101:>+13.1%}{wind:>+11.1%}{disp:>+12.1%}{p106:>+13.1%}{combo:>+11.2%}")
 
 # --- homemaker-to-workforce detail ---
-print("\n  Dual-Income Household Transition (homemakers → workforce):")
-print(f"  {'Year':<6}{'HM count':>10}{'Leaving':>10}{'New ent. inc':>14}{'Cum. ent. inc':>14}")
-print("  " + "-" * 56)
-hm_data = [(106, hm_cnt_106, hm_lv_106, cum_ent_106),
-           (107, hm_cnt_107, hm_lv_107, cum_ent_107),
-           (108, hm_cnt_108, hm_lv_108, cum_ent_108),
-           (109, hm_cnt_109, hm_lv_109, cum_ent_109),
-           (110, hm_cnt_110, hm_lv_110, cum_ent_110)]
+out.append("\n  Dual-Income Household Transition (homemakers → workforce):")
+out.append(f"  {'Year':<6}{'HM count':>10}{'Leaving':>10}{'New ent. inc':>14}{'Cum. ent. inc':>14}")
+out.append("  " + "-" * 56)
+hm_data = zip(YEARS_106_110.tolist(), hm_count_106_110, hm_leaving_106_110, cum_ent_106_110)
 for y, cnt, lv, cum in hm_data:
-    print(f"  {y:<6}{cnt:>9.1f}{lv:>9.2f}{lv * NEW_ENTRANT_INCOME:>13,.0f}{cum:>13,.0f}")
-
-print("\n" + "=" * 70)
-print("Confidence notes:")
-print("  - Sturgeon cycle confirmed shifted; surges at 101,104,107,110")
-print("  - If cycle drifts +1yr: HIGH moves to 109 instead of 108")
-print("  - No disaster events modelled (next locust est. Year 120+)")
-print("  - Wind transition: −3 % GDP p.a. is the dominant drag; partially")
-print("    offset by Prestige-106 ramp from Year 107 onward")
-print("  - Resident displeasure adds −0.5…−1.5 % on top of transition drag;")
-print("    channels: tourism decline, civic morale, productivity loss")
-print("  - Homemaker exit adds ~$6-7 k/yr in new income (small vs GDP)")
-print("  - Weather assumed normal beyond 105 (no data available)")
-print("  - Growth rates derived from 100→105 actual profession totals")
-print("=" * 70)
-
+    out.append(f"  {y:<6}{cnt:>9.1f}{lv:>9.2f}{lv * NEW_ENTRANT_INCOME:>13,.0f}{cum:>13,.0f}")
+
+out.append("\n" + "=" * 70)
+out.append("Confidence notes:")
+out.append("  - Sturgeon cycle confirmed shifted; surges at 101,104,107,110")
+out.append("  - If cycle drifts +1yr: HIGH moves to 109 instead of 108")
+out.append("  - No disaster events modelled (next locust est. Year 120+)")
+out.append("  - Wind transition: −3 % GDP p.a. is the dominant drag; partially")
+out.append("    offset by Prestige-106 ramp from Year 107 onward")
+out.append("  - Resident displeasure adds −0.5…−1.5 % on top of transition drag;")
+out.append("    channels: tourism decline, civic morale, productivity loss")
+out.append("  - Homemaker exit adds ~$6-7 k/yr in new income (small vs GDP)")
+out.append("  - Weather assumed normal beyond 105 (no data available)")
+out.append("  - Growth rates derived from 100→105 actual profession totals")
+out.append("=" * 70)
 # =============================================================================
 # POST-MORTEM: YEARS 106-110 FORECAST VS ACTUAL
 # =============================================================================
-print("\n" + "=" * 70)
-print("YEARS 106-110: FORECAST vs ACTUAL (Post-Mortem)")
-print("=" * 70)
-print(f"{'Year':<6}{'Forecast':>14}{'Actual':>14}{'Fcst Err':>10}{'Act YoY':>10}")
-print("-" * 70)
-
-prev_actual = ACTUAL_GDP[105]
-for year in range(106, 111):
-    fcast = new_forecasts[year]
-    actual = ACTUAL_GDP[year]
-    err = ((actual - fcast) / fcast) * 100
-    yoy = ((actual - prev_actual) / prev_actual) * 100
-    print(f"{year:<6}{fcast:>14,.0f}{actual:>14,.0f}{err:>+9.1f}%{yoy:>+9.1f}%")
-    prev_actual = actual
-
-print("-" * 70)
-print("  106: Wind transition drag + prestige carryover; fisher LOW")
-print("  107: DROUGHT hit farmers hard (-67% income); fisher LOW")
-print("  108: Farmer partial recovery; fisher HIGH (107 surge)")
-print("  109: Continued recovery; fisher LOW")
-print("  110: Farmer stabilizing; fisher LOW (surge year)")
+out.append("\n" + "=" * 70)
+out.append("YEARS 106-110: FORECAST vs ACTUAL (Post-Mortem)")
+out.append("=" * 70)
+out.append(f"{'Year':<6}{'Forecast':>14}{'Actual':>14}{'Fcst Err':>10}{'Act YoY':>10}")
+out.append("-" * 70)
+
+out.extend(map(format_fva_row, forecast_vs_actual(new_forecasts, ACTUAL_GDP, ACTUAL_GDP[105], range(106, 111))))
+
+out.append("-" * 70)
+out.append("  106: Wind transition drag + prestige carryover; fisher LOW")
+out.append("  107: DROUGHT hit farmers hard (-67% income); fisher LOW")
+out.append("  108: Farmer partial recovery; fisher HIGH (107 surge)")
+out.append("  109: Continued recovery; fisher LOW")
+out.append("  110: Farmer stabilizing; fisher LOW (surge year)")
 
 # =============================================================================
 # YEARS 106-110: PROFESSION ACTUALS (from population_hage_island_year110.csv)
 # =============================================================================
-print("\n" + "=" * 70)
-print("YEARS 106-110: PROFESSION TOTAL INCOME (actuals)")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("YEARS 106-110: PROFESSION TOTAL INCOME (actuals)")
+out.append("=" * 70)
 prof_keys_new = ['farmer', 'fisher', 'craftsman', 'service provider', 'civil servant',
                  'retired', 'homemaker', 'unemployed']
-print(f"{'Profession':<20}", end="")
-for y in range(106, 111):
-    print(f"{y:>12}", end="")
-print()
-print("-" * 80)
-for prof in prof_keys_new:
-    print(f"{prof:<20}", end="")
-    for y in range(106, 111):
-        print(f"{profession_income[y].get(prof, 0):>12,.0f}", end="")
-    print()
-print("-" * 80)
-print(f"{'TOTAL GDP':<20}", end="")
-for y in range(106, 111):
-    print(f"{sum(profession_income[y].values()):>12,.0f}", end="")
-print()
+format_prof_row_5 = prof_row_format(5)
+out.append(f"{'Profession':<20}" + "".join(f"{y:>12}" for y in range(106, 111)))
+out.append("-" * 80)
+actuals_106_110 = profession_income[106:111, [PROF[prof] for prof in prof_keys_new]].T
+for prof, row in zip(prof_keys_new, actuals_106_110.tolist()):
+    out.append(format_prof_row_5(prof, *row))
+out.append("-" * 80)
+out.append(format_prof_row_5('TOTAL GDP', *profession_income[106:111].sum(axis=1).tolist()))
 
 # =============================================================================
 # RECALIBRATED PARAMETERS FROM YEARS 106-110 ACTUALS
@@ -832,13 +721,13 @@ print()
 #   HIGH income (1-yr lag): 102, 105, 108, 111...
 #   Fisher HIGH avg declining: 4256(102), 4143(105), 3978(108)
 #   Fisher LOW avg: ~2400-2500
-FISHER_HIGH_AVG_110 = (profession_income[102]['fisher']/workforce[102]['fisher'] +
-                       profession_income[105]['fisher']/workforce[105]['fisher'] +
-                       profession_income[108]['fisher']/workforce[108]['fisher']) / 3  # ~4125
-FISHER_LOW_AVG_110 = (profession_income[106]['fisher']/workforce[106]['fisher'] +
-                      profession_income[107]['fisher']/workforce[107]['fisher'] +
-                      profession_income[109]['fisher']/workforce[109]['fisher'] +
-                      profession_income[110]['fisher']/workforce[110]['fisher']) / 4  # ~2400
+# Only the referenced years are divided; a year with no fishers raises instead of averaging in $0
+fisher_high_years, fisher_low_years = [102, 105, 108], [106, 107, 109, 110]
+with np.errstate(divide='raise', invalid='raise'):
+    FISHER_HIGH_AVG_110 = (profession_income[fisher_high_years, PROF['fisher']]
+                           / workforce[fisher_high_years, PROF['fisher']]).mean()  # ~4125
+    FISHER_LOW_AVG_110  = (profession_income[fisher_low_years, PROF['fisher']]
+                           / workforce[fisher_low_years, PROF['fisher']]).mean()   # ~2400
 
 # Drought pattern: Year 107 was a severe drought (-67% farmer income)
 # Historical drought years: 3,7,10,17,24,31,38,42-43,45,52,59,62,66,73,80,83-84,87,94,107
@@ -853,6 +742,7 @@ CRAFTSMAN_GROWTH_110 = -0.003   # slight decline
 SERVICE_GROWTH_110 = -0.005     # slight decline
 CIVIL_SERVANT_GROWTH_110 = 0.011  # still growing
 FARMER_GROWTH_110 = 0.005  # recovery growth (post-drought)
+FARMER_MULT_110 = 1 + FARMER_GROWTH_110  # year-on-year factor for the farmer chain below
 
 # =============================================================================
 # NEW POLICIES FOR YEARS 111-116
@@ -923,8 +813,15 @@ TAX_REDISTRIBUTION_DRAG = {
     115: -0.008   # Stabilized drag
 }
 
-# Calculate 75th percentile income for reference
-p75_income_110 = np.percentile(individual_incomes[110], 75) if individual_incomes[110] else 4000
+# Year 110 income quantiles, computed once: p75 is the reference here and all four feed the
+# distribution statistics below (individual_incomes only has keys for years with positive incomes;
+# without any, the statistics read as $0 / Gini 0 and the reference falls back to $4,000)
+incomes_110 = individual_incomes.get(110, np.empty(0))
+if len(incomes_110):
+    p25_110, p50_110, p75_110, p90_110 = np.percentile(incomes_110, [25, 50, 75, 90]).tolist()
+else:
+    p25_110 = p50_110 = p75_110 = p90_110 = 0.0
+p75_income_110 = p75_110 if len(incomes_110) else 4000
 
 # (D) Prestige Project 106 continuation (effects through Year 111)
 #     Reduced from 3% to 1.5% - residual benefits taper more quickly
@@ -936,15 +833,17 @@ WIND_TRANSITION_ENDS = 110
 # =============================================================================
 # YEAR 110 ACTUALS (baselines for Year 111+ forecast)
 # =============================================================================
-fisher_110_act = profession_income[110]['fisher']
-farmer_110_act = profession_income[110]['farmer']
-craftsman_110_act = profession_income[110]['craftsman']
-service_110_act = profession_income[110]['service provider']
-civil_110_act = profession_income[110]['civil servant']
-retired_110_act = profession_income[110].get('retired', 35000)
-homemaker_110_act = profession_income[110].get('homemaker', -18000)
-unemployed_110_act = profession_income[110].get('unemployed', -5000)
-fisher_count_110 = workforce[110]['fisher']
+fisher_110_act = profession_income[110, PROF['fisher']]
+farmer_110_act = profession_income[110, PROF['farmer']]
+craftsman_110_act = profession_income[110, PROF['craftsman']]
+service_110_act = profession_income[110, PROF['service provider']]
+civil_110_act = profession_income[110, PROF['civil servant']]
+retired_110_act = prof_cell_or(profession_income, 110, 'retired', 35000)
+homemaker_110_act = prof_cell_or(profession_income, 110, 'homemaker', -18000)
+unemployed_110_act = prof_cell_or(profession_income, 110, 'unemployed', -5000)
+fisher_count_110 = workforce[110, PROF['fisher']]
+FISHER_HIGH_BASE_110 = FISHER_HIGH_AVG_110 * fisher_count_110  # fleet income in a HIGH year
+FISHER_LOW_BASE_110 = FISHER_LOW_AVG_110 * fisher_count_110    # fleet income in a LOW year
 
 # Retired projection continues
 RETIRED_PROJ_EXT = {111: 36000, 112: 38000, 113: 40000, 114: 42000, 115: 44000, 116: 46000}
@@ -952,8 +851,22 @@ RETIRED_PROJ_EXT = {111: 36000, 112: 38000, 113: 40000, 114: 42000, 115: 44000,
 # Population productivity (stable growth)
 POP_PRODUCTIVITY_111 = {111: 1.001, 112: 1.001, 113: 1.001, 114: 1.001, 115: 1.001, 116: 1.001}
 
-# Homemaker tracking continues
-hm_count_110_act = workforce[110].get('homemaker', 40)
+# Homemaker tracking continues from the Year 110 actuals, same recurrence as 106-110
+hm_count_110_act = prof_cell_or(workforce, 110, 'homemaker', 40)
+_, _, hm_income_111_116, unemp_111_116, cum_ent_111_116 = homemaker_exit_path(
+    hm_count_110_act, homemaker_110_act, unemployed_110_act, cum_entrant_inc, 6)
+
+# Combined GDP-level policy multiplier per year; a policy not active in a year adds a factor of 1
+YEARS_111_116 = np.arange(111, 117)
+policy_boosts_111_116 = year_table([PRESTIGE_106_BOOST_EXT, COMMUNITY_CENTER_BOOST, SPORTS_FACILITIES_BOOST,
+                                    DROUGHT_CROPS_COST, TAX_REDISTRIBUTION_DRAG], YEARS_111_116)
+policy_111_116 = np.prod(1 + policy_boosts_111_116, axis=0)
+
+# Compounded growth series from the Year 110 actuals (index = year - 110)
+years_past_110 = np.arange(7)
+craftsman_series_110 = craftsman_110_act * (1 + CRAFTSMAN_GROWTH_110) ** years_past_110
+service_series_110 = service_110_act * (1 + SERVICE_GROWTH_110) ** years_past_110
+civil_series_110 = civil_110_act * (1 + CIVIL_SERVANT_GROWTH_110) ** years_past_110
 
 # =============================================================================
 # YEARS 111-116: FORECAST (New policies active)
@@ -961,149 +874,53 @@ hm_count_110_act = workforce[110].get('homemaker', 40)
 # Sturgeon cycle: 110 surge → 111 HIGH, 112 LOW, 113 LOW (surge), 114 HIGH, 115 LOW, 116 LOW (surge)
 # Drought projection: Possible drought around 114-117 (using 115 as estimate)
 
-# --- Year 111: Fisher HIGH (110 surge), Tax redistribution starts ---
-fisher_111 = FISHER_HIGH_AVG_110 * fisher_count_110
-farmer_111 = farmer_110_act * (1 + FARMER_GROWTH_110)
-craftsman_111 = craftsman_110_act * (1 + CRAFTSMAN_GROWTH_110)
-service_111 = service_110_act * (1 + SERVICE_GROWTH_110)
-civil_111 = civil_110_act * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_111 = RETIRED_PROJ_EXT[111]
-hm_count_111 = hm_count_110_act * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_111 = homemaker_110_act * (1 + HOME_UNEMP_GROWTH) * (hm_count_111 / hm_count_110_act)
-unemp_111 = unemployed_110_act * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_111 = cum_entrant_inc * (1 + ENTRANT_GROWTH) + (hm_count_110_act - hm_count_111) * NEW_ENTRANT_INCOME
-
-prof_sum_111 = (fisher_111 + farmer_111 + craftsman_111 + service_111 + civil_111 +
-                retired_111 + hm_income_111 + unemp_111 + cum_entrant_111)
-policy_111 = ((1 + PRESTIGE_106_BOOST_EXT.get(111, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(111, 0)) *
-              (1 + TAX_REDISTRIBUTION_DRAG.get(111, 0)))
-gdp_111 = prof_sum_111 * POP_PRODUCTIVITY_111[111] * policy_111
-
-# --- Year 112: Fisher LOW, Community center starts ---
-fisher_112 = FISHER_LOW_AVG_110 * fisher_count_110
-farmer_112 = farmer_111 * (1 + FARMER_GROWTH_110)
-craftsman_112 = craftsman_111 * (1 + CRAFTSMAN_GROWTH_110)
-service_112 = service_111 * (1 + SERVICE_GROWTH_110)
-civil_112 = civil_111 * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_112 = RETIRED_PROJ_EXT[112]
-hm_count_112 = hm_count_111 * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_112 = hm_income_111 * (1 + HOME_UNEMP_GROWTH) * (hm_count_112 / hm_count_111)
-unemp_112 = unemp_111 * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_112 = cum_entrant_111 * (1 + ENTRANT_GROWTH) + (hm_count_111 - hm_count_112) * NEW_ENTRANT_INCOME
-
-prof_sum_112 = (fisher_112 + farmer_112 + craftsman_112 + service_112 + civil_112 +
-                retired_112 + hm_income_112 + unemp_112 + cum_entrant_112)
-policy_112 = ((1 + COMMUNITY_CENTER_BOOST.get(112, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(112, 0)) *
-              (1 + TAX_REDISTRIBUTION_DRAG.get(112, 0)))
-gdp_112 = prof_sum_112 * POP_PRODUCTIVITY_111[112] * policy_112
-
-# --- Year 113: Fisher LOW (surge year), Tax redistribution final year ---
-fisher_113 = FISHER_LOW_AVG_110 * fisher_count_110
-farmer_113 = farmer_112 * (1 + FARMER_GROWTH_110)
-craftsman_113 = craftsman_112 * (1 + CRAFTSMAN_GROWTH_110)
-service_113 = service_112 * (1 + SERVICE_GROWTH_110)
-civil_113 = civil_112 * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_113 = RETIRED_PROJ_EXT[113]
-hm_count_113 = hm_count_112 * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_113 = hm_income_112 * (1 + HOME_UNEMP_GROWTH) * (hm_count_113 / hm_count_112)
-unemp_113 = unemp_112 * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_113 = cum_entrant_112 * (1 + ENTRANT_GROWTH) + (hm_count_112 - hm_count_113) * NEW_ENTRANT_INCOME
-
-prof_sum_113 = (fisher_113 + farmer_113 + craftsman_113 + service_113 + civil_113 +
-                retired_113 + hm_income_113 + unemp_113 + cum_entrant_113)
-policy_113 = ((1 + COMMUNITY_CENTER_BOOST.get(113, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(113, 0)) *
-              (1 + TAX_REDISTRIBUTION_DRAG.get(113, 0)))
-gdp_113 = prof_sum_113 * POP_PRODUCTIVITY_111[113] * policy_113
-
-# --- Year 114: Fisher HIGH (113 surge), Tax ended, Drought crops start ---
-fisher_114 = FISHER_HIGH_AVG_110 * fisher_count_110
-# Apply farmer resistance to drought-resistant crops (Year 1 of adoption)
-farmer_114 = farmer_113 * (1 + FARMER_GROWTH_110) * (1 + FARMER_CROP_RESISTANCE.get(114, 0))
-craftsman_114 = craftsman_113 * (1 + CRAFTSMAN_GROWTH_110)
-service_114 = service_113 * (1 + SERVICE_GROWTH_110)
-civil_114 = civil_113 * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_114 = RETIRED_PROJ_EXT[114]
-hm_count_114 = hm_count_113 * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_114 = hm_income_113 * (1 + HOME_UNEMP_GROWTH) * (hm_count_114 / hm_count_113)
-unemp_114 = unemp_113 * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_114 = cum_entrant_113 * (1 + ENTRANT_GROWTH) + (hm_count_113 - hm_count_114) * NEW_ENTRANT_INCOME
-
-prof_sum_114 = (fisher_114 + farmer_114 + craftsman_114 + service_114 + civil_114 +
-                retired_114 + hm_income_114 + unemp_114 + cum_entrant_114)
-policy_114 = ((1 + COMMUNITY_CENTER_BOOST.get(114, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(114, 0)) *
-              (1 + DROUGHT_CROPS_COST.get(114, 0)) *
-              (1 + TAX_REDISTRIBUTION_DRAG.get(114, 0)))
-gdp_114 = prof_sum_114 * POP_PRODUCTIVITY_111[114] * policy_114
-
-# --- Year 115: Fisher LOW, Drought crops Year 2, POTENTIAL DROUGHT YEAR ---
-# Model drought with 40% probability based on 7-year cycle pattern
+# Fisher: HIGH in 111 and 114 (the year after a surge), LOW otherwise
+fisher_high_111_116 = np.array([True, False, False, True, False, False])
+fisher_111_116 = np.where(fisher_high_111_116, FISHER_HIGH_BASE_110, FISHER_LOW_BASE_110)
+
+# Farmer: recovery growth through 113, then drought-resistant crop adoption from 114
+farmer_111_116 = np.empty(6)
+farmer_111_116[:3] = farmer_110_act * FARMER_MULT_110 ** np.arange(1, 4)
+# 114: farmer resistance to drought-resistant crops (Year 1 of adoption)
+farmer_111_116[3] = farmer_111_116[2] * FARMER_MULT_110 * (1 + FARMER_CROP_RESISTANCE.get(114, 0))
+# 115: POTENTIAL DROUGHT YEAR, modelled with 40% probability based on 7-year cycle pattern
+#      Drought scenario: farmer income -67%, mitigated by 50% due to drought-resistant crops
+#      Apply farmer resistance Year 2 (reduced from Year 1), adjusting for prior year's resistance
 DROUGHT_PROBABILITY_115 = 0.40
-fisher_115 = FISHER_LOW_AVG_110 * fisher_count_110
-# Drought scenario: farmer income -67%, mitigated by 50% due to drought-resistant crops
-# Apply farmer resistance Year 2 (reduced from Year 1), adjusting for prior year's resistance
-farmer_115_base = farmer_114 / (1 + FARMER_CROP_RESISTANCE.get(114, 0))  # Remove Year 1 resistance
-farmer_115_no_drought = farmer_115_base * (1 + FARMER_GROWTH_110) * (1 + FARMER_CROP_RESISTANCE.get(115, 0))
+farmer_115_base = farmer_111_116[3] / (1 + FARMER_CROP_RESISTANCE.get(114, 0))  # Remove Year 1 resistance
+farmer_115_no_drought = farmer_115_base * FARMER_MULT_110 * (1 + FARMER_CROP_RESISTANCE.get(115, 0))
 farmer_115_with_drought = farmer_115_base * (1 + DROUGHT_FARMER_DAMAGE) * (1 + DROUGHT_CROPS_PROTECTION * 0.67) * (1 + FARMER_CROP_RESISTANCE.get(115, 0))
 # Use expected value: weighted average
-farmer_115 = farmer_115_no_drought * (1 - DROUGHT_PROBABILITY_115) + farmer_115_with_drought * DROUGHT_PROBABILITY_115
-craftsman_115 = craftsman_114 * (1 + CRAFTSMAN_GROWTH_110)
-service_115 = service_114 * (1 + SERVICE_GROWTH_110)
-civil_115 = civil_114 * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_115 = RETIRED_PROJ_EXT[115]
-hm_count_115 = hm_count_114 * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_115 = hm_income_114 * (1 + HOME_UNEMP_GROWTH) * (hm_count_115 / hm_count_114)
-unemp_115 = unemp_114 * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_115 = cum_entrant_114 * (1 + ENTRANT_GROWTH) + (hm_count_114 - hm_count_115) * NEW_ENTRANT_INCOME
-
-prof_sum_115 = (fisher_115 + farmer_115 + craftsman_115 + service_115 + civil_115 +
-                retired_115 + hm_income_115 + unemp_115 + cum_entrant_115)
-policy_115 = ((1 + COMMUNITY_CENTER_BOOST.get(115, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(115, 0)) *
-              (1 + DROUGHT_CROPS_COST.get(115, 0)) *
-              (1 + TAX_REDISTRIBUTION_DRAG.get(115, 0)))
-gdp_115 = prof_sum_115 * POP_PRODUCTIVITY_111[115] * policy_115
-
-# --- Year 116: Fisher LOW (surge year), Drought crops mature ---
-fisher_116 = FISHER_LOW_AVG_110 * fisher_count_110
-# Farmer resistance decreases in Year 2; recovery boost if drought occurred in 115
-farmer_116 = farmer_115 * (1 + FARMER_GROWTH_110) * 1.10 * (1 + FARMER_CROP_RESISTANCE.get(116, 0)) / (1 + FARMER_CROP_RESISTANCE.get(115, 0))  # Adjust for changing resistance
-craftsman_116 = craftsman_115 * (1 + CRAFTSMAN_GROWTH_110)
-service_116 = service_115 * (1 + SERVICE_GROWTH_110)
-civil_116 = civil_115 * (1 + CIVIL_SERVANT_GROWTH_110)
-retired_116 = RETIRED_PROJ_EXT[116]
-hm_count_116 = hm_count_115 * (1 - HOMEMAKER_EXIT_RATE)
-hm_income_116 = hm_income_115 * (1 + HOME_UNEMP_GROWTH) * (hm_count_116 / hm_count_115)
-unemp_116 = unemp_115 * (1 + HOME_UNEMP_GROWTH)
-cum_entrant_116 = cum_entrant_115 * (1 + ENTRANT_GROWTH) + (hm_count_115 - hm_count_116) * NEW_ENTRANT_INCOME
-
-prof_sum_116 = (fisher_116 + farmer_116 + craftsman_116 + service_116 + civil_116 +
-                retired_116 + hm_income_116 + unemp_116 + cum_entrant_116)
-policy_116 = ((1 + COMMUNITY_CENTER_BOOST.get(116, 0)) *
-              (1 + SPORTS_FACILITIES_BOOST.get(116, 0)) *
-              (1 + DROUGHT_CROPS_COST.get(116, 0)))
-gdp_116 = prof_sum_116 * POP_PRODUCTIVITY_111[116] * policy_116
-
-forecasts_111_115 = {111: gdp_111, 112: gdp_112, 113: gdp_113, 114: gdp_114, 115: gdp_115}
+farmer_111_116[4] = farmer_115_no_drought * (1 - DROUGHT_PROBABILITY_115) + farmer_115_with_drought * DROUGHT_PROBABILITY_115
+# 116: resistance decreases; recovery boost if drought occurred in 115
+farmer_111_116[5] = farmer_111_116[4] * FARMER_MULT_110 * 1.10 * (1 + FARMER_CROP_RESISTANCE.get(116, 0)) / (1 + FARMER_CROP_RESISTANCE.get(115, 0))  # Adjust for changing resistance
+
+retired_111_116 = year_table([RETIRED_PROJ_EXT], YEARS_111_116, default=None)[0]
+
+# Profession sum (one row per income source), policies and GDP
+income_111_116 = np.vstack([fisher_111_116, farmer_111_116, craftsman_series_110[1:], service_series_110[1:],
+                            civil_series_110[1:], retired_111_116, hm_income_111_116, unemp_111_116,
+                            cum_ent_111_116])
+prof_sum_111_116 = income_111_116.sum(axis=0)
+gdp_111_116 = prof_sum_111_116 * year_table([POP_PRODUCTIVITY_111], YEARS_111_116, default=None)[0] * policy_111_116
+
+forecasts_111_115 = dict(zip(YEARS_111_116[:5].tolist(), gdp_111_116[:5].tolist()))
 
 # =============================================================================
 # OUTPUT: YEARS 111-115 FORECAST
 # =============================================================================
-print("\n" + "=" * 80)
-print("YEARS 111-115: FORECAST (New policies active)")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("YEARS 111-115: FORECAST (New policies active)")
+out.append("=" * 80)
 
-print("\nNew Policies Enacted in Year 111:")
-print(f"  Public Sports Facilities: Built Year 111; benefits Years 111-115 (+0.8-1.0% GDP)")
-print(f"  Tax Redistribution:      Years 111-115; 10% increase on >75th percentile income")
-print(f"                           (75th percentile in Year 110: ${p75_income_110:,.0f})")
-print(f"  Drought Resistant Crops: Implemented Years 114-115; -0.5% transition cost")
-print(f"                           50% protection against drought damage")
-print(f"  Farmer Resistance:       Year 114: -8% farmer income (adoption ~40%)")
-print(f"                           Year 115: -4% farmer income (adoption ~65%)")
+out.append("\nNew Policies Enacted in Year 111:")
+out.append(f"  Public Sports Facilities: Built Year 111; benefits Years 111-115 (+0.8-1.0% GDP)")
+out.append(f"  Tax Redistribution:      Years 111-115; 10% increase on >75th percentile income")
+out.append(f"                           (75th percentile in Year 110: ${p75_income_110:,.0f})")
+out.append(f"  Drought Resistant Crops: Implemented Years 114-115; -0.5% transition cost")
+out.append(f"                           50% protection against drought damage")
+out.append(f"  Farmer Resistance:       Year 114: -8% farmer income (adoption ~40%)")
+out.append(f"                           Year 115: -4% farmer income (adoption ~65%)")
 
 notes_111_115 = {
     111: "Fisher HIGH (110 surge); Prestige-106 +1.5%; Sports +1%; Tax drag -1.5%",
@@ -1113,50 +930,43 @@ notes_111_115 = {
     115: "Fisher LOW; Tax drag -0.8%; Drought crops -0.5%; Farmer resistance -4%; Drought risk 40%"
 }
 
-print(f"\n{'Year':<6}{'GDP Forecast':>15}{'YoY Chg':>10}  Notes")
-print("-" * 95)
-print(f"{'110':<6}{ACTUAL_GDP[110]:>15,.2f}{'':>10}  Actual (baseline)")
+out.append(f"\n{'Year':<6}{'GDP Forecast':>15}{'YoY Chg':>10}  Notes")
+out.append("-" * 95)
+out.append(f"{'110':<6}{ACTUAL_GDP[110]:>15,.2f}{'':>10}  Actual (baseline)")
 
-prev = ACTUAL_GDP[110]
-for year in range(111, 116):
-    gdp_f = forecasts_111_115[year]
-    chg = ((gdp_f - prev) / prev) * 100
-    print(f"{year:<6}{gdp_f:>15,.2f}{chg:>+9.1f}%  {notes_111_115[year]}")
-    prev = gdp_f
+gdps_111_115 = np.array([ACTUAL_GDP[110]] + [forecasts_111_115[y] for y in range(111, 116)])
+chgs_111_115 = np.diff(gdps_111_115) / gdps_111_115[:-1] * 100
+for year, gdp_f, chg in zip(range(111, 116), gdps_111_115[1:], chgs_111_115):
+    out.append(f"{year:<6}{gdp_f:>15,.2f}{chg:>+9.1f}%  {notes_111_115[year]}")
 
 # --- Policy multiplier breakdown 111-115 ---
-print("\n" + "=" * 80)
-print("POLICY MULTIPLIER BREAKDOWN (Years 111-115)")
-print("=" * 80)
-print(f"{'Year':<6}{'Prestige-106':>13}{'Community':>11}{'Sports':>10}{'Tax Drag':>11}{'Drought':>10}{'Combined':>12}")
-print("-" * 80)
-for y in range(111, 116):
-    p106 = PRESTIGE_106_BOOST_EXT.get(y, 0.0)
-    comm = COMMUNITY_CENTER_BOOST.get(y, 0.0)
-    sport = SPORTS_FACILITIES_BOOST.get(y, 0.0)
-    tax = TAX_REDISTRIBUTION_DRAG.get(y, 0.0)
-    drought = DROUGHT_CROPS_COST.get(y, 0.0)
-    combo = (1 + p106) * (1 + comm) * (1 + sport) * (1 + tax) * (1 + drought)
-    print(f"{y:<6}{p106:>+12.1%}{comm:>+10.1%}{sport:>+9.1%}{tax:>+10.1%}{drought:>+9.1%}{combo:>+11.2%}")
+out.append("\n" + "=" * 80)
+out.append("POLICY MULTIPLIER BREAKDOWN (Years 111-115)")
+out.append("=" * 80)
+out.append(f"{'Year':<6}{'Prestige-106':>13}{'Community':>11}{'Sports':>10}{'Tax Drag':>11}{'Drought':>10}{'Combined':>12}")
+out.append("-" * 80)
+for y, (p106, comm, sport, drought, tax), combo in zip(YEARS_111_116[:5].tolist(), policy_boosts_111_116.T.tolist(),
+                                                      policy_111_116.tolist()):
+    out.append(f"{y:<6}{p106:>+12.1%}{comm:>+10.1%}{sport:>+9.1%}{tax:>+10.1%}{drought:>+9.1%}{combo:>+11.2%}")
 
 # --- Drought-resistant crops analysis ---
-print("\n" + "=" * 80)
-print("DROUGHT-RESISTANT CROPS ANALYSIS")
-print("=" * 80)
-print("\nHistorical Drought Years (farmer avg income <$1000):")
-print("  Years: 3, 7, 10, 17, 24, 31, 38, 42-43, 45, 52, 59, 62, 66, 73, 80, 83-84, 87, 94, 107")
-print("  Pattern: ~7 year cycle with clustering")
-print("\nYear 107 Drought Impact:")
-print(f"  Farmer income: ${profession_income[106]['farmer']/workforce[106]['farmer']:,.0f} (106)")
-print(f"              → ${profession_income[107]['farmer']/workforce[107]['farmer']:,.0f} (107 drought)")
-print(f"              → ${profession_income[108]['farmer']/workforce[108]['farmer']:,.0f} (108 recovery)")
-print(f"  Damage: -67% farmer income")
-print("\nNext Drought Projection:")
-print("  Based on 7-year cycle from Year 107: Next drought ~Year 114-117")
-print("  Probability estimate: 40% chance in Year 115")
-print("\nFarmer Resistance to New Crops (adoption curve):")
-print(f"  {'Year':<6}{'Resistance':>12}{'Adoption Rate':>16}{'Channels'}")
-print("  " + "-" * 70)
+out.append("\n" + "=" * 80)
+out.append("DROUGHT-RESISTANT CROPS ANALYSIS")
+out.append("=" * 80)
+out.append("\nHistorical Drought Years (farmer avg income <$1000):")
+out.append("  Years: 3, 7, 10, 17, 24, 31, 38, 42-43, 45, 52, 59, 62, 66, 73, 80, 83-84, 87, 94, 107")
+out.append("  Pattern: ~7 year cycle with clustering")
+out.append("\nYear 107 Drought Impact:")
+out.append(f"  Farmer income: ${profession_income[106, PROF['farmer']]/workforce[106, PROF['farmer']]:,.0f} (106)")
+out.append(f"              → ${profession_income[107, PROF['farmer']]/workforce[107, PROF['farmer']]:,.0f} (107 drought)")
+out.append(f"              → ${profession_income[108, PROF['farmer']]/workforce[108, PROF['farmer']]:,.0f} (108 recovery)")
+out.append(f"  Damage: -67% farmer income")
+out.append("\nNext Drought Projection:")
+out.append("  Based on 7-year cycle from Year 107: Next drought ~Year 114-117")
+out.append("  Probability estimate: 40% chance in Year 115")
+out.append("\nFarmer Resistance to New Crops (adoption curve):")
+out.append(f"  {'Year':<6}{'Resistance':>12}{'Adoption Rate':>16}{'Channels'}")
+out.append("  " + "-" * 70)
 for y in [114, 115, 116, 117]:
     resist = FARMER_CROP_RESISTANCE.get(y, 0)
     adoption = {114: "~40%", 115: "~65%", 116: "~85%", 117: "~95%"}
@@ -1166,49 +976,48 @@ for y in [114, 115, 116, 117]:
         116: "Widespread acceptance, proven results",
         117: "Full adoption, resistance negligible"
     }
-    print(f"  {y:<6}{resist:>+11.0%}{adoption[y]:>16}  {channels[y]}")
-
-print("\nPolicy Recommendation: ENACT DROUGHT-RESISTANT CROPS")
-print("  - Implementation cost: -0.5% GDP in Years 114-115")
-print("  - Protection: Reduces drought damage by 50%")
-print("  - Farmer resistance: -8% farmer income (Yr 114), -4% (Yr 115)")
-print("    Channels: Skepticism, traditional preferences, learning curve")
-print("  - Expected value: Still positive despite resistance;")
-print("    drought protection value exceeds adoption costs over 3+ years")
-
-print("\n" + "=" * 80)
-print("SUMMARY: 5-YEAR OUTLOOK (Years 111-115)")
-print("=" * 80)
-print(f"\nBaseline GDP (Year 110): ${ACTUAL_GDP[110]:,.2f}")
-print(f"Forecast GDP (Year 115): ${gdp_115:,.2f}")
+    out.append(f"  {y:<6}{resist:>+11.0%}{adoption[y]:>16}  {channels[y]}")
+
+out.append("\nPolicy Recommendation: ENACT DROUGHT-RESISTANT CROPS")
+out.append("  - Implementation cost: -0.5% GDP in Years 114-115")
+out.append("  - Protection: Reduces drought damage by 50%")
+out.append("  - Farmer resistance: -8% farmer income (Yr 114), -4% (Yr 115)")
+out.append("    Channels: Skepticism, traditional preferences, learning curve")
+out.append("  - Expected value: Still positive despite resistance;")
+out.append("    drought protection value exceeds adoption costs over 3+ years")
+
+out.append("\n" + "=" * 80)
+out.append("SUMMARY: 5-YEAR OUTLOOK (Years 111-115)")
+out.append("=" * 80)
+out.append(f"\nBaseline GDP (Year 110): ${ACTUAL_GDP[110]:,.2f}")
+gdp_115 = forecasts_111_115[115]
+out.append(f"Forecast GDP (Year 115): ${gdp_115:,.2f}")
 total_growth = ((gdp_115 - ACTUAL_GDP[110]) / ACTUAL_GDP[110]) * 100
-print(f"Total Growth: {total_growth:+.1f}%")
-print(f"Annualized Growth: {((gdp_115/ACTUAL_GDP[110])**(1/5) - 1)*100:+.1f}%")
+out.append(f"Total Growth: {total_growth:+.1f}%")
+out.append(f"Annualized Growth: {((gdp_115/ACTUAL_GDP[110])**(1/5) - 1)*100:+.1f}%")
 
-print("\nKey Risks:")
-print("  - Drought in 114-117 window (mitigated by drought-resistant crops)")
-print("  - Farmer resistance to new crops may slow adoption (-8% to -4% farmer income)")
-print("  - Tax redistribution may reduce high-earner investment")
-print("  - Sturgeon cycle volatility (fisher income swings ±70%)")
-print("\nKey Opportunities:")
-print("  - Community center and sports facilities boost social cohesion")
-print("  - Drought-resistant crops provide agricultural resilience")
-print("  - Civil servant sector continues stable growth")
-print("=" * 80)
+out.append("\nKey Risks:")
+out.append("  - Drought in 114-117 window (mitigated by drought-resistant crops)")
+out.append("  - Farmer resistance to new crops may slow adoption (-8% to -4% farmer income)")
+out.append("  - Tax redistribution may reduce high-earner investment")
+out.append("  - Sturgeon cycle volatility (fisher income swings ±70%)")
+out.append("\nKey Opportunities:")
+out.append("  - Community center and sports facilities boost social cohesion")
+out.append("  - Drought-resistant crops provide agricultural resilience")
+out.append("  - Civil servant sector continues stable growth")
+out.append("=" * 80)
 
 # =============================================================================
 # GINI COEFFICIENT ANALYSIS AND PREDICTION
 # =============================================================================
 
 def calculate_gini(incomes):
-    """Calculate Gini coefficient from a list of incomes."""
-    if len(incomes) == 0:
-        return 0.0
+    """Calculate Gini coefficient from an array of incomes."""
+    incomes = np.asarray(incomes)
     # Filter to positive incomes only for Gini calculation
-    pos_incomes = [i for i in incomes if i > 0]
-    if len(pos_incomes) == 0:
+    sorted_incomes = np.sort(incomes[incomes > 0])
+    if len(sorted_incomes) == 0:
         return 0.0
-    sorted_incomes = sorted(pos_incomes)
     n = len(sorted_incomes)
     cumsum = np.cumsum(sorted_incomes)
     return (2 * np.sum((np.arange(1, n + 1) * sorted_incomes)) / (n * cumsum[-1])) - (n + 1) / n
@@ -1216,21 +1025,17 @@ def calculate_gini(incomes):
 # Calculate historical Gini coefficients (Years 100-110)
 historical_gini = {}
 for year in range(100, 111):
-    if year in individual_incomes and len(individual_incomes[year]) > 0:
+    if year in individual_incomes:   # present only for years with positive incomes
         historical_gini[year] = calculate_gini(individual_incomes[year])
 
-# Get income distribution statistics for Year 110
-incomes_110 = individual_incomes[110]
-p25_110 = np.percentile(incomes_110, 25)
-p50_110 = np.percentile(incomes_110, 50)  # median
-p75_110 = np.percentile(incomes_110, 75)
-p90_110 = np.percentile(incomes_110, 90)
-mean_110 = np.mean(incomes_110)
-gini_110 = historical_gini[110]
+# Get income distribution statistics for Year 110 (incomes_110 and its quantiles loaded above;
+# p50_110 is the median)
+mean_110 = incomes_110.mean() if len(incomes_110) else 0.0
+gini_110 = historical_gini.get(110, 0.0)
 
 # Identify high earners (>75th percentile) and their share
-high_earners_110 = [i for i in incomes_110 if i > p75_110]
-high_earner_share_110 = sum(high_earners_110) / sum(incomes_110)
+high_earners_110 = incomes_110[incomes_110 > p75_110]
+high_earner_share_110 = high_earners_110.sum() / incomes_110.sum() if len(incomes_110) else 0.0
 
 # =============================================================================
 # GINI PREDICTION MODEL
@@ -1307,44 +1112,39 @@ for year in range(111, 116):
 # =============================================================================
 # OUTPUT: GINI COEFFICIENT ANALYSIS
 # =============================================================================
-print("\n" + "=" * 80)
-print("GINI COEFFICIENT ANALYSIS AND PREDICTION")
-print("=" * 80)
-
-print("\nYear 110 Income Distribution (baseline):")
-print(f"  Population with income: {len(incomes_110)}")
-print(f"  Mean income:           ${mean_110:,.0f}")
-print(f"  25th percentile:       ${p25_110:,.0f}")
-print(f"  Median (50th):         ${p50_110:,.0f}")
-print(f"  75th percentile:       ${p75_110:,.0f}")
-print(f"  90th percentile:       ${p90_110:,.0f}")
-print(f"  High earner share:     {high_earner_share_110:.1%} of total income (top 25%)")
-print(f"  Gini coefficient:      {gini_110:.4f}")
-
-print("\nHistorical Gini Coefficients (Years 100-110):")
-print(f"  {'Year':<6}{'Gini':>8}{'YoY Change':>12}")
-print("  " + "-" * 26)
-prev_g = None
-for year in range(100, 111):
-    g = historical_gini.get(year, 0)
-    if prev_g is not None:
-        chg = g - prev_g
-        print(f"  {year:<6}{g:>8.4f}{chg:>+11.4f}")
-    else:
-        print(f"  {year:<6}{g:>8.4f}{'':>12}")
-    prev_g = g
-
-print("\nPolicy Effects on Income Inequality:")
-print(f"  Tax Redistribution (>75th pctl):  Reduces Gini by 0.006-0.012/year")
-print(f"  Fisher HIGH years:                Increases Gini by ~0.008 (mid-high earners gain)")
-print(f"  Fisher LOW years:                 Decreases Gini by ~0.005")
-print(f"  Farmer resistance:                Increases Gini by ~0.002-0.003")
-print(f"  Community/Sports:                 Decreases Gini by ~0.002 (broad benefits)")
-
-print("\nPredicted Gini Coefficients (Years 111-115):")
-print(f"  {'Year':<6}{'Gini':>8}{'Change':>10}{'Tax':>8}{'Fisher':>8}{'Other':>8}  Notes")
-print("  " + "-" * 70)
-print(f"  {'110':<6}{gini_110:>8.4f}{'':>10}{'':>8}{'':>8}{'':>8}  Actual (baseline)")
+out.append("\n" + "=" * 80)
+out.append("GINI COEFFICIENT ANALYSIS AND PREDICTION")
+out.append("=" * 80)
+
+out.append("\nYear 110 Income Distribution (baseline):")
+out.append(f"  Population with income: {len(incomes_110)}")
+out.append(f"  Mean income:           ${mean_110:,.0f}")
+out.append(f"  25th percentile:       ${p25_110:,.0f}")
+out.append(f"  Median (50th):         ${p50_110:,.0f}")
+out.append(f"  75th percentile:       ${p75_110:,.0f}")
+out.append(f"  90th percentile:       ${p90_110:,.0f}")
+out.append(f"  High earner share:     {high_earner_share_110:.1%} of total income (top 25%)")
+out.append(f"  Gini coefficient:      {gini_110:.4f}")
+
+out.append("\nHistorical Gini Coefficients (Years 100-110):")
+out.append(f"  {'Year':<6}{'Gini':>8}{'YoY Change':>12}")
+out.append("  " + "-" * 26)
+ginis = np.array([historical_gini.get(year, 0) for year in range(100, 111)])
+out.append(f"  {100:<6}{ginis[0]:>8.4f}{'':>12}")
+for year, g, chg in zip(range(101, 111), ginis[1:], np.diff(ginis)):
+    out.append(f"  {year:<6}{g:>8.4f}{chg:>+11.4f}")
+
+out.append("\nPolicy Effects on Income Inequality:")
+out.append(f"  Tax Redistribution (>75th pctl):  Reduces Gini by 0.006-0.012/year")
+out.append(f"  Fisher HIGH years:                Increases Gini by ~0.008 (mid-high earners gain)")
+out.append(f"  Fisher LOW years:                 Decreases Gini by ~0.005")
+out.append(f"  Farmer resistance:                Increases Gini by ~0.002-0.003")
+out.append(f"  Community/Sports:                 Decreases Gini by ~0.002 (broad benefits)")
+
+out.append("\nPredicted Gini Coefficients (Years 111-115):")
+out.append(f"  {'Year':<6}{'Gini':>8}{'Change':>10}{'Tax':>8}{'Fisher':>8}{'Other':>8}  Notes")
+out.append("  " + "-" * 70)
+out.append(f"  {'110':<6}{gini_110:>8.4f}{'':>10}{'':>8}{'':>8}{'':>8}  Actual (baseline)")
 
 for year in range(111, 116):
     g = predicted_gini[year]
@@ -1353,42 +1153,36 @@ for year in range(111, 116):
     fisher = FISHER_GINI_EFFECT.get(year, 0)
     other = FARMER_RESISTANCE_GINI.get(year, 0) + COMMUNITY_GINI_EFFECT.get(year, 0)
     fisher_note = "HIGH" if fisher > 0 else "LOW"
-    print(f"  {year:<6}{g:>8.4f}{chg:>+9.4f}{tax:>+7.3f}{fisher:>+7.3f}{other:>+7.3f}  Fisher {fisher_note}")
+    out.append(f"  {year:<6}{g:>8.4f}{chg:>+9.4f}{tax:>+7.3f}{fisher:>+7.3f}{other:>+7.3f}  Fisher {fisher_note}")
 
-print("\nGini Interpretation:")
-print(f"  Year 110 Gini: {gini_110:.4f}")
-print(f"  Year 115 Gini: {predicted_gini[115]:.4f} (predicted)")
+out.append("\nGini Interpretation:")
+out.append(f"  Year 110 Gini: {gini_110:.4f}")
+out.append(f"  Year 115 Gini: {predicted_gini[115]:.4f} (predicted)")
 gini_change = predicted_gini[115] - gini_110
-print(f"  5-Year Change: {gini_change:+.4f} ({'more equal' if gini_change < 0 else 'more unequal'})")
-print("\n  Gini Scale Reference:")
-print("    0.25-0.30: Low inequality (Nordic countries)")
-print("    0.30-0.35: Moderate inequality")
-print("    0.35-0.40: Moderate-high inequality")
-print("    0.40-0.50: High inequality (US ~0.41)")
-print("=" * 80)
+out.append(f"  5-Year Change: {gini_change:+.4f} ({'more equal' if gini_change < 0 else 'more unequal'})")
+out.append("\n  Gini Scale Reference:")
+out.append("    0.25-0.30: Low inequality (Nordic countries)")
+out.append("    0.30-0.35: Moderate inequality")
+out.append("    0.35-0.40: Moderate-high inequality")
+out.append("    0.40-0.50: High inequality (US ~0.41)")
+out.append("=" * 80)
 
 # =============================================================================
 # POST-MORTEM: YEARS 111-115 FORECAST VS ACTUAL
 # =============================================================================
-print("\n" + "=" * 80)
-print("POST-MORTEM: YEARS 111-115 FORECAST VS ACTUAL")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("POST-MORTEM: YEARS 111-115 FORECAST VS ACTUAL")
+out.append("=" * 80)
 
-print("\nGDP Forecast vs Actual:")
-print(f"  {'Year':<6}{'Forecast':>14}{'Actual':>14}{'Error':>10}{'Act YoY':>10}")
-print("  " + "-" * 54)
-prev_actual = ACTUAL_GDP[110]
-for year in range(111, 116):
-    fcast = forecasts_111_115[year]
-    actual = ACTUAL_GDP[year]
-    err = ((actual - fcast) / fcast) * 100
-    yoy = ((actual - prev_actual) / prev_actual) * 100
-    print(f"  {year:<6}{fcast:>14,.0f}{actual:>14,.0f}{err:>+9.1f}%{yoy:>+9.1f}%")
-    prev_actual = actual
-
-print("\nGini Forecast vs Actual:")
-print(f"  {'Year':<6}{'Forecast':>10}{'Full Econ':>12}{'Formal':>10}{'Note'}")
-print("  " + "-" * 60)
+out.append("\nGDP Forecast vs Actual:")
+out.append(f"  {'Year':<6}{'Forecast':>14}{'Actual':>14}{'Error':>10}{'Act YoY':>10}")
+out.append("  " + "-" * 54)
+out.extend(map(format_fva_row_indented,
+               forecast_vs_actual(forecasts_111_115, ACTUAL_GDP, ACTUAL_GDP[110], range(111, 116))))
+
+out.append("\nGini Forecast vs Actual:")
+out.append(f"  {'Year':<6}{'Forecast':>10}{'Full Econ':>12}{'Formal':>10}{'Note'}")
+out.append("  " + "-" * 60)
 for year in range(111, 116):
     fcast_g = predicted_gini[year]
     actual_full = ACTUAL_GINI[year]['full']
@@ -1396,28 +1190,28 @@ for year in range(111, 116):
     # Compare forecast to formal economy Gini
     diff = actual_formal - fcast_g
     note = "Raiders/gangs increase full economy inequality"
-    print(f"  {year:<6}{fcast_g:>10.4f}{actual_full:>12.2f}{actual_formal:>10.2f}  {note if year == 111 else ''}")
+    out.append(f"  {year:<6}{fcast_g:>10.4f}{actual_full:>12.2f}{actual_formal:>10.2f}  {note if year == 111 else ''}")
 
-print("\nKey Insights from Actuals:")
-print("  GDP:")
+out.append("\nKey Insights from Actuals:")
+out.append("  GDP:")
 total_gdp_growth = ((ACTUAL_GDP[115] - ACTUAL_GDP[110]) / ACTUAL_GDP[110]) * 100
-print(f"    - Total growth 110→115: {total_gdp_growth:+.1f}%")
-print(f"    - Year 111 actual (+20.8%) exceeded forecast (+17.2%)")
-print(f"    - Year 115 actual ($981k) close to forecast ($983k)")
+out.append(f"    - Total growth 110→115: {total_gdp_growth:+.1f}%")
+out.append(f"    - Year 111 actual (+20.8%) exceeded forecast (+17.2%)")
+out.append(f"    - Year 115 actual ($981k) close to forecast ($983k)")
 
-print("\n  Gini (Income Inequality):")
-print("    - Two measures tracked: Full economy vs Formal economy")
-print("    - Full economy Gini (0.46-0.54) includes raiders/gangs income")
-print("    - Formal economy Gini (0.37-0.40) excludes illegal income")
-print("    - Raiders/gangs add ~0.10-0.14 to inequality measure")
-print("    - Formal Gini trend: 0.37→0.40→0.37 (slight improvement by 115)")
+out.append("\n  Gini (Income Inequality):")
+out.append("    - Two measures tracked: Full economy vs Formal economy")
+out.append("    - Full economy Gini (0.46-0.54) includes raiders/gangs income")
+out.append("    - Formal economy Gini (0.37-0.40) excludes illegal income")
+out.append("    - Raiders/gangs add ~0.10-0.14 to inequality measure")
+out.append("    - Formal Gini trend: 0.37→0.40→0.37 (slight improvement by 115)")
 
-print("\n  Wellbeing Implications:")
-print("    - High full-economy Gini indicates significant shadow economy")
-print("    - Raiders/gangs concentrate wealth outside formal system")
-print("    - Tax redistribution helping formal economy equality")
-print("    - Need policies addressing informal/illegal economy for wellbeing")
-print("=" * 80)
+out.append("\n  Wellbeing Implications:")
+out.append("    - High full-economy Gini indicates significant shadow economy")
+out.append("    - Raiders/gangs concentrate wealth outside formal system")
+out.append("    - Tax redistribution helping formal economy equality")
+out.append("    - Need policies addressing informal/illegal economy for wellbeing")
+out.append("=" * 80)
 
 # =============================================================================
 # YEARS 116-120 FORECAST (New policies)
@@ -1653,34 +1447,33 @@ for year in range(116, 121):
 # =============================================================================
 # OUTPUT: YEARS 116-120 FORECAST
 # =============================================================================
-print("\n" + "=" * 80)
-print("YEARS 116-120 FORECAST: WELLBEING FOCUS")
-print("=" * 80)
-
-print("\nNew Policies:")
-print("  (A) Community Center:      Tax increase Year 116 (-0.8% GDP)")
-print("                             Benefits Years 117-120 (+1.0-1.5% GDP, +2-4 happiness)")
-print("  (B) Security Infrastructure: All years 116-120 (-0.5% cost, +0.2-1.0% benefit)")
-print("                             Reduces raider impact on happiness (+1-4 pts)")
-print("  (C) Training Programmes:   Year 116 only (+1.2% GDP, +1 happiness)")
-print("  (D) Trade Agreement:       Year 118 onwards (+1.5-2.5% GDP, +1.5-2 happiness)")
-
-print("\nRaider/Gang Effects:")
-print("  - Raiders add ~1.5% to GDP (shadow economy)")
-print("  - Raiders reduce happiness by 2-5 points")
-print("  - Security infrastructure gradually reduces both effects")
-
-print("\n" + "-" * 80)
-print("GDP FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'GDP':>14}{'YoY Chg':>10}{'Fisher':>8}  Notes")
-print("  " + "-" * 60)
-print(f"  {'115':<6}{GDP_115:>14,.0f}{'':>10}{'':>8}  Actual (baseline)")
-
-prev = GDP_115
-for year in range(116, 121):
-    gdp = gdp_forecasts_116_120[year]
-    chg = ((gdp - prev) / prev) * 100
+out.append("\n" + "=" * 80)
+out.append("YEARS 116-120 FORECAST: WELLBEING FOCUS")
+out.append("=" * 80)
+
+out.append("\nNew Policies:")
+out.append("  (A) Community Center:      Tax increase Year 116 (-0.8% GDP)")
+out.append("                             Benefits Years 117-120 (+1.0-1.5% GDP, +2-4 happiness)")
+out.append("  (B) Security Infrastructure: All years 116-120 (-0.5% cost, +0.2-1.0% benefit)")
+out.append("                             Reduces raider impact on happiness (+1-4 pts)")
+out.append("  (C) Training Programmes:   Year 116 only (+1.2% GDP, +1 happiness)")
+out.append("  (D) Trade Agreement:       Year 118 onwards (+1.5-2.5% GDP, +1.5-2 happiness)")
+
+out.append("\nRaider/Gang Effects:")
+out.append("  - Raiders add ~1.5% to GDP (shadow economy)")
+out.append("  - Raiders reduce happiness by 2-5 points")
+out.append("  - Security infrastructure gradually reduces both effects")
+
+out.append("\n" + "-" * 80)
+out.append("GDP FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'GDP':>14}{'YoY Chg':>10}{'Fisher':>8}  Notes")
+out.append("  " + "-" * 60)
+out.append(f"  {'115':<6}{GDP_115:>14,.0f}{'':>10}{'':>8}  Actual (baseline)")
+
+gdps_116_120 = np.array([GDP_115] + [gdp_forecasts_116_120[y] for y in range(116, 121)])
+chgs_116_120 = np.diff(gdps_116_120) / gdps_116_120[:-1] * 100
+for year, gdp, chg in zip(range(116, 121), gdps_116_120[1:], chgs_116_120):
     fisher = FISHER_CYCLE_116_120[year]
     notes = []
     if year == 116: notes.append("Training +1.2%")
@@ -1688,67 +1481,66 @@ for year in range(116, 121):
     if year >= 117: notes.append(f"Community +{COMMUNITY_CENTER_BENEFIT.get(year,0)*100:.1f}%")
     if year >= 118: notes.append(f"Trade +{TRADE_AGREEMENT_BOOST.get(year,0)*100:.1f}%")
     note_str = "; ".join(notes) if notes else ""
-    print(f"  {year:<6}{gdp:>14,.0f}{chg:>+9.1f}%{fisher:>8}  {note_str}")
-    prev = gdp
+    out.append(f"  {year:<6}{gdp:>14,.0f}{chg:>+9.1f}%{fisher:>8}  {note_str}")
 
-print("\n" + "-" * 80)
-print("HAPPINESS FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'Happiness':>10}{'Change':>10}{'Raider':>10}{'Security':>10}")
-print("  " + "-" * 50)
-print(f"  {'115':<6}{HAPPINESS_BASELINE:>10.1f}{'':>10}{'':>10}{'':>10}  Baseline")
+out.append("\n" + "-" * 80)
+out.append("HAPPINESS FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'Happiness':>10}{'Change':>10}{'Raider':>10}{'Security':>10}")
+out.append("  " + "-" * 50)
+out.append(f"  {'115':<6}{HAPPINESS_BASELINE:>10.1f}{'':>10}{'':>10}{'':>10}  Baseline")
 
 for year in range(116, 121):
     happy = happiness_forecasts[year]
     chg = happy - (HAPPINESS_BASELINE if year == 116 else happiness_forecasts[year-1])
     raider = RAIDER_HAPPINESS_DRAG[year]
     security = SECURITY_HAPPINESS_BOOST[year]
-    print(f"  {year:<6}{happy:>10.1f}{chg:>+9.1f}{raider:>+9.1f}{security:>+9.1f}")
+    out.append(f"  {year:<6}{happy:>10.1f}{chg:>+9.1f}{raider:>+9.1f}{security:>+9.1f}")
 
-print("\n" + "-" * 80)
-print("GINI COEFFICIENT FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'Formal':>10}{'Full Econ':>12}{'Raider Gap':>12}  Notes")
-print("  " + "-" * 55)
-print(f"  {'115':<6}{GINI_115_FORMAL:>10.2f}{GINI_115_FULL:>12.2f}{GINI_115_FULL-GINI_115_FORMAL:>12.2f}  Actual")
+out.append("\n" + "-" * 80)
+out.append("GINI COEFFICIENT FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'Formal':>10}{'Full Econ':>12}{'Raider Gap':>12}  Notes")
+out.append("  " + "-" * 55)
+out.append(f"  {'115':<6}{GINI_115_FORMAL:>10.2f}{GINI_115_FULL:>12.2f}{GINI_115_FULL-GINI_115_FORMAL:>12.2f}  Actual")
 
 for year in range(116, 121):
     formal = gini_formal_forecasts[year]
     full = gini_full_forecasts[year]
     gap = full - formal
     notes = "Security reducing gap" if year >= 118 else ""
-    print(f"  {year:<6}{formal:>10.2f}{full:>12.2f}{gap:>12.2f}  {notes}")
+    out.append(f"  {year:<6}{formal:>10.2f}{full:>12.2f}{gap:>12.2f}  {notes}")
 
-print("\n" + "-" * 80)
-print("WELLBEING SUMMARY (Years 116-120)")
-print("-" * 80)
+out.append("\n" + "-" * 80)
+out.append("WELLBEING SUMMARY (Years 116-120)")
+out.append("-" * 80)
 gdp_growth_total = ((gdp_forecasts_116_120[120] - GDP_115) / GDP_115) * 100
 happiness_change = happiness_forecasts[120] - HAPPINESS_BASELINE
 gini_formal_change = gini_formal_forecasts[120] - GINI_115_FORMAL
 gini_full_change = gini_full_forecasts[120] - GINI_115_FULL
 
-print(f"\n  GDP:")
-print(f"    Year 115: ${GDP_115:,.0f}")
-print(f"    Year 120: ${gdp_forecasts_116_120[120]:,.0f}")
-print(f"    5-Year Growth: {gdp_growth_total:+.1f}%")
+out.append(f"\n  GDP:")
+out.append(f"    Year 115: ${GDP_115:,.0f}")
+out.append(f"    Year 120: ${gdp_forecasts_116_120[120]:,.0f}")
+out.append(f"    5-Year Growth: {gdp_growth_total:+.1f}%")
 
-print(f"\n  Happiness:")
-print(f"    Year 115: {HAPPINESS_BASELINE:.1f}")
-print(f"    Year 120: {happiness_forecasts[120]:.1f}")
-print(f"    5-Year Change: {happiness_change:+.1f} points")
+out.append(f"\n  Happiness:")
+out.append(f"    Year 115: {HAPPINESS_BASELINE:.1f}")
+out.append(f"    Year 120: {happiness_forecasts[120]:.1f}")
+out.append(f"    5-Year Change: {happiness_change:+.1f} points")
 
-print(f"\n  Gini (Inequality):")
-print(f"    Formal Economy: {GINI_115_FORMAL:.2f} → {gini_formal_forecasts[120]:.2f} ({gini_formal_change:+.2f})")
-print(f"    Full Economy:   {GINI_115_FULL:.2f} → {gini_full_forecasts[120]:.2f} ({gini_full_change:+.2f})")
-print(f"    Raider Gap:     {GINI_115_FULL-GINI_115_FORMAL:.2f} → {gini_full_forecasts[120]-gini_formal_forecasts[120]:.2f}")
+out.append(f"\n  Gini (Inequality):")
+out.append(f"    Formal Economy: {GINI_115_FORMAL:.2f} → {gini_formal_forecasts[120]:.2f} ({gini_formal_change:+.2f})")
+out.append(f"    Full Economy:   {GINI_115_FULL:.2f} → {gini_full_forecasts[120]:.2f} ({gini_full_change:+.2f})")
+out.append(f"    Raider Gap:     {GINI_115_FULL-GINI_115_FORMAL:.2f} → {gini_full_forecasts[120]-gini_formal_forecasts[120]:.2f}")
 
-print("\n  Key Findings:")
-print("    - Security infrastructure gradually reduces raider impact")
-print("    - Trade agreement provides sustained GDP growth from Year 118")
-print("    - Community center improves happiness significantly from Year 117")
-print("    - Formal economy inequality stable; full economy gap shrinking")
-print("    - Fisher cycle creates volatility (HIGH years: 117, 120)")
-print("=" * 80)
+out.append("\n  Key Findings:")
+out.append("    - Security infrastructure gradually reduces raider impact")
+out.append("    - Trade agreement provides sustained GDP growth from Year 118")
+out.append("    - Community center improves happiness significantly from Year 117")
+out.append("    - Formal economy inequality stable; full economy gap shrinking")
+out.append("    - Fisher cycle creates volatility (HIGH years: 117, 120)")
+out.append("=" * 80)
 
 # =============================================================================
 # POST-MORTEM: YEARS 116-120 FORECAST VS ACTUAL
@@ -1777,58 +1569,52 @@ ACTUAL_GINI_116_120 = {
     120: {'full': 0.58, 'formal': 0.35}
 }
 
-print("\n" + "=" * 80)
-print("POST-MORTEM: YEARS 116-120 FORECAST VS ACTUAL")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("POST-MORTEM: YEARS 116-120 FORECAST VS ACTUAL")
+out.append("=" * 80)
 
-print("\nGDP Forecast vs Actual:")
-print(f"  {'Year':<6}{'Forecast':>14}{'Actual':>14}{'Error':>10}{'Act YoY':>10}")
-print("  " + "-" * 54)
-prev_act = ACTUAL_GDP[115]
-for year in range(116, 121):
-    fcast = gdp_forecasts_116_120[year]
-    actual = ACTUAL_GDP_116_120[year]
-    err = ((actual - fcast) / fcast) * 100
-    yoy = ((actual - prev_act) / prev_act) * 100
-    print(f"  {year:<6}{fcast:>14,.0f}{actual:>14,.0f}{err:>+9.1f}%{yoy:>+9.1f}%")
-    prev_act = actual
-
-print("\nHappiness Forecast vs Actual:")
-print(f"  {'Year':<6}{'Forecast':>10}{'Actual':>10}{'Error':>10}")
-print("  " + "-" * 40)
+out.append("\nGDP Forecast vs Actual:")
+out.append(f"  {'Year':<6}{'Forecast':>14}{'Actual':>14}{'Error':>10}{'Act YoY':>10}")
+out.append("  " + "-" * 54)
+out.extend(map(format_fva_row_indented,
+               forecast_vs_actual(gdp_forecasts_116_120, ACTUAL_GDP_116_120, ACTUAL_GDP[115], range(116, 121))))
+
+out.append("\nHappiness Forecast vs Actual:")
+out.append(f"  {'Year':<6}{'Forecast':>10}{'Actual':>10}{'Error':>10}")
+out.append("  " + "-" * 40)
 for year in range(116, 121):
     fcast_h = happiness_forecasts[year]
     actual_h = ACTUAL_HAPPINESS_116_120[year]
     err_h = actual_h - fcast_h
-    print(f"  {year:<6}{fcast_h:>10.1f}{actual_h:>10.2f}{err_h:>+9.1f}")
+    out.append(f"  {year:<6}{fcast_h:>10.1f}{actual_h:>10.2f}{err_h:>+9.1f}")
 
-print("\nGini Forecast vs Actual:")
-print(f"  {'Year':<6}{'Fcst Formal':>12}{'Act Formal':>12}{'Fcst Full':>12}{'Act Full':>10}")
-print("  " + "-" * 52)
+out.append("\nGini Forecast vs Actual:")
+out.append(f"  {'Year':<6}{'Fcst Formal':>12}{'Act Formal':>12}{'Fcst Full':>12}{'Act Full':>10}")
+out.append("  " + "-" * 52)
 for year in range(116, 121):
     ff = gini_formal_forecasts[year]
     af = ACTUAL_GINI_116_120[year]['formal']
     gf = gini_full_forecasts[year]
     ag = ACTUAL_GINI_116_120[year]['full']
-    print(f"  {year:<6}{ff:>12.2f}{af:>12.2f}{gf:>12.2f}{ag:>10.2f}")
-
-print("\nKey Observations from 116-120 Actuals:")
-print("  GDP:")
-print("    - Year 116-117 forecasts were close (errors <2.5%)")
-print("    - Years 118-119 experienced a severe economic shock (-12% to -22% error)")
-print("    - Year 118-119 crash likely caused by: drought (~7yr cycle from 107),")
-print("      raider/shadow economy expansion (full Gini spiked to 0.67),")
-print("      and compound negative effects during fisher LOW years")
-print("    - Year 120 (fisher HIGH) recovered strongly but still below forecast")
-print("  Happiness:")
-print("    - Model baseline of 100 was wrong; actual baseline ~88-89")
-print("    - Happiness tracks GDP closely: lowest in Year 118 (83.81) with lowest GDP")
-print("    - Security/community benefits less effective than modeled")
-print("  Gini:")
-print("    - Formal Gini stable (0.35-0.39), model was close")
-print("    - Full economy Gini much higher than forecast (0.58-0.67 vs 0.46-0.51)")
-print("    - Raider gap WIDENED in crisis (0.28 in Y118 vs forecast 0.13)")
-print("    - Raiders exploited economic downturn to expand shadow economy")
+    out.append(f"  {year:<6}{ff:>12.2f}{af:>12.2f}{gf:>12.2f}{ag:>10.2f}")
+
+out.append("\nKey Observations from 116-120 Actuals:")
+out.append("  GDP:")
+out.append("    - Year 116-117 forecasts were close (errors <2.5%)")
+out.append("    - Years 118-119 experienced a severe economic shock (-12% to -22% error)")
+out.append("    - Year 118-119 crash likely caused by: drought (~7yr cycle from 107),")
+out.append("      raider/shadow economy expansion (full Gini spiked to 0.67),")
+out.append("      and compound negative effects during fisher LOW years")
+out.append("    - Year 120 (fisher HIGH) recovered strongly but still below forecast")
+out.append("  Happiness:")
+out.append("    - Model baseline of 100 was wrong; actual baseline ~88-89")
+out.append("    - Happiness tracks GDP closely: lowest in Year 118 (83.81) with lowest GDP")
+out.append("    - Security/community benefits less effective than modeled")
+out.append("  Gini:")
+out.append("    - Formal Gini stable (0.35-0.39), model was close")
+out.append("    - Full economy Gini much higher than forecast (0.58-0.67 vs 0.46-0.51)")
+out.append("    - Raider gap WIDENED in crisis (0.28 in Y118 vs forecast 0.13)")
+out.append("    - Raiders exploited economic downturn to expand shadow economy")
 
 # =============================================================================
 # RECALIBRATED PARAMETERS FROM YEARS 116-120 ACTUALS
@@ -2147,41 +1933,40 @@ for year in range(121, 126):
 # =============================================================================
 # OUTPUT: YEARS 121-125 FORECAST
 # =============================================================================
-print("\n" + "=" * 80)
-print("YEARS 121-125 FORECAST: REVISED MODEL")
-print("(Recalibrated from 116-120 actuals + New Year 120 policies)")
-print("=" * 80)
-
-print("\nNew Policies Enacted in Year 120:")
-print("  (I) Dual-Income Households (strengthened):")
-print("       - Incentives doubled: 4% homemaker exit rate (was 2%)")
-print("       - Childcare subsidies + tax breaks for dual earners")
-print("       - GDP: +0.3-0.9%; Happiness: +0.5; Gini: -0.001 to -0.002")
-print("  (J) Retirement Age raised to 90 (from 70):")
-print("       - Workers 70-90 retained at ~40-60% productivity")
-print("       - GDP: +0.8-1.6%; Happiness: -2.5 to -1.0 (elderly dissatisfaction)")
-print("       - Gini: +0.001 to +0.003 (elderly earn less, widens spread)")
-print("  (K) Lower Taxes for Bottom 25% of Workforce:")
-print("       - Increased disposable income for lowest earners")
-print("       - GDP: +0.8-1.0% (consumer spending); Happiness: +2.0 to +2.5")
-print("       - Gini: -0.003 to -0.005 (direct inequality reduction)")
-
-print("\nFisher Cycle (confirmed from 116-120):")
-print("  Surges: 116, 119, 122, 125... → HIGH: 117, 120, 123, 126...")
-print("  Year 121: LOW | 122: LOW (surge) | 123: HIGH | 124: LOW | 125: LOW (surge)")
-print("  Year 123 = predicted increase (fisher HIGH + mature policies)")
-
-print("\n" + "-" * 80)
-print("GDP FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'GDP':>14}{'YoY Chg':>10}{'Fisher':>8}  Notes")
-print("  " + "-" * 65)
-print(f"  {'120':<6}{GDP_120:>14,.0f}{'':>10}{'HIGH':>8}  Actual (baseline)")
-
-prev_p = GDP_120
-for year in range(121, 126):
-    gdp_v = gdp_forecasts_121_125[year]
-    chg = ((gdp_v - prev_p) / prev_p) * 100
+out.append("\n" + "=" * 80)
+out.append("YEARS 121-125 FORECAST: REVISED MODEL")
+out.append("(Recalibrated from 116-120 actuals + New Year 120 policies)")
+out.append("=" * 80)
+
+out.append("\nNew Policies Enacted in Year 120:")
+out.append("  (I) Dual-Income Households (strengthened):")
+out.append("       - Incentives doubled: 4% homemaker exit rate (was 2%)")
+out.append("       - Childcare subsidies + tax breaks for dual earners")
+out.append("       - GDP: +0.3-0.9%; Happiness: +0.5; Gini: -0.001 to -0.002")
+out.append("  (J) Retirement Age raised to 90 (from 70):")
+out.append("       - Workers 70-90 retained at ~40-60% productivity")
+out.append("       - GDP: +0.8-1.6%; Happiness: -2.5 to -1.0 (elderly dissatisfaction)")
+out.append("       - Gini: +0.001 to +0.003 (elderly earn less, widens spread)")
+out.append("  (K) Lower Taxes for Bottom 25% of Workforce:")
+out.append("       - Increased disposable income for lowest earners")
+out.append("       - GDP: +0.8-1.0% (consumer spending); Happiness: +2.0 to +2.5")
+out.append("       - Gini: -0.003 to -0.005 (direct inequality reduction)")
+
+out.append("\nFisher Cycle (confirmed from 116-120):")
+out.append("  Surges: 116, 119, 122, 125... → HIGH: 117, 120, 123, 126...")
+out.append("  Year 121: LOW | 122: LOW (surge) | 123: HIGH | 124: LOW | 125: LOW (surge)")
+out.append("  Year 123 = predicted increase (fisher HIGH + mature policies)")
+
+out.append("\n" + "-" * 80)
+out.append("GDP FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'GDP':>14}{'YoY Chg':>10}{'Fisher':>8}  Notes")
+out.append("  " + "-" * 65)
+out.append(f"  {'120':<6}{GDP_120:>14,.0f}{'':>10}{'HIGH':>8}  Actual (baseline)")
+
+gdps_121_125 = np.array([GDP_120] + [gdp_forecasts_121_125[y] for y in range(121, 126)])
+chgs_121_125 = np.diff(gdps_121_125) / gdps_121_125[:-1] * 100
+for year, gdp_v, chg in zip(range(121, 126), gdps_121_125[1:], chgs_121_125):
     fisher = FISHER_CYCLE_121_125[year]
     notes = []
     notes.append(f"Ret90 +{RETIREMENT_90_GDP_BOOST[year]*100:.1f}%")
@@ -2189,15 +1974,14 @@ for year in range(121, 126):
     if DROUGHT_RISK_121_125[year] >= 0.20:
         notes.append(f"Drought risk {DROUGHT_RISK_121_125[year]:.0%}")
     note_str = "; ".join(notes)
-    print(f"  {year:<6}{gdp_v:>14,.0f}{chg:>+9.1f}%{fisher:>8}  {note_str}")
-    prev_p = gdp_v
+    out.append(f"  {year:<6}{gdp_v:>14,.0f}{chg:>+9.1f}%{fisher:>8}  {note_str}")
 
-print("\n" + "-" * 80)
-print("HAPPINESS FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'Happiness':>10}{'Change':>10}{'GDP Eff':>10}{'Tax Relief':>12}{'Ret90':>8}")
-print("  " + "-" * 56)
-print(f"  {'120':<6}{HAPPINESS_BASELINE_120:>10.2f}{'':>10}{'':>10}{'':>12}{'':>8}  Baseline")
+out.append("\n" + "-" * 80)
+out.append("HAPPINESS FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'Happiness':>10}{'Change':>10}{'GDP Eff':>10}{'Tax Relief':>12}{'Ret90':>8}")
+out.append("  " + "-" * 56)
+out.append(f"  {'120':<6}{HAPPINESS_BASELINE_120:>10.2f}{'':>10}{'':>10}{'':>12}{'':>8}  Baseline")
 
 for year in range(121, 126):
     happy_v = happiness_forecasts_121_125[year]
@@ -2207,14 +1991,14 @@ for year in range(121, 126):
     gdp_eff = min(3.0, max(-3.0, gdp_gr * HAPPINESS_GDP_SENSITIVITY))
     tax_h = TAX_RELIEF_25_HAPPINESS[year]
     ret_h = RETIREMENT_90_HAPPINESS[year]
-    print(f"  {year:<6}{happy_v:>10.2f}{chg_h:>+9.2f}{gdp_eff:>+9.2f}{tax_h:>+11.1f}{ret_h:>+7.1f}")
+    out.append(f"  {year:<6}{happy_v:>10.2f}{chg_h:>+9.2f}{gdp_eff:>+9.2f}{tax_h:>+11.1f}{ret_h:>+7.1f}")
 
-print("\n" + "-" * 80)
-print("GINI COEFFICIENT FORECAST")
-print("-" * 80)
-print(f"  {'Year':<6}{'Formal':>10}{'Full Econ':>12}{'Raider Gap':>12}{'Fisher':>8}  Notes")
-print("  " + "-" * 60)
-print(f"  {'120':<6}{ACTUAL_GINI_116_120[120]['formal']:>10.3f}{ACTUAL_GINI_116_120[120]['full']:>12.3f}{RAIDER_GAP_120:>12.3f}{'HIGH':>8}  Actual")
+out.append("\n" + "-" * 80)
+out.append("GINI COEFFICIENT FORECAST")
+out.append("-" * 80)
+out.append(f"  {'Year':<6}{'Formal':>10}{'Full Econ':>12}{'Raider Gap':>12}{'Fisher':>8}  Notes")
+out.append("  " + "-" * 60)
+out.append(f"  {'120':<6}{ACTUAL_GINI_116_120[120]['formal']:>10.3f}{ACTUAL_GINI_116_120[120]['full']:>12.3f}{RAIDER_GAP_120:>12.3f}{'HIGH':>8}  Actual")
 
 for year in range(121, 126):
     formal_v = gini_formal_121_125[year]
@@ -2224,14 +2008,14 @@ for year in range(121, 126):
     notes_g = []
     notes_g.append(f"Tax25 {TAX_RELIEF_25_GINI_FORMAL[year]:+.3f}")
     note_g_str = "; ".join(notes_g)
-    print(f"  {year:<6}{formal_v:>10.3f}{full_v:>12.3f}{gap_v:>12.3f}{fisher_v:>8}  {note_g_str}")
+    out.append(f"  {year:<6}{formal_v:>10.3f}{full_v:>12.3f}{gap_v:>12.3f}{fisher_v:>8}  {note_g_str}")
 
 # =============================================================================
 # SUMMARY
 # =============================================================================
-print("\n" + "-" * 80)
-print("5-YEAR OUTLOOK SUMMARY (Years 121-125)")
-print("-" * 80)
+out.append("\n" + "-" * 80)
+out.append("5-YEAR OUTLOOK SUMMARY (Years 121-125)")
+out.append("-" * 80)
 
 gdp_growth_5yr = ((gdp_forecasts_121_125[125] - GDP_120) / GDP_120) * 100
 annualized = ((gdp_forecasts_121_125[125] / GDP_120) ** (1/5) - 1) * 100
@@ -2239,51 +2023,53 @@ happiness_change_5yr = happiness_forecasts_121_125[125] - HAPPINESS_BASELINE_120
 gini_formal_change_5yr = gini_formal_121_125[125] - ACTUAL_GINI_116_120[120]['formal']
 gini_full_change_5yr = gini_full_121_125[125] - ACTUAL_GINI_116_120[120]['full']
 
-print(f"\n  GDP:")
-print(f"    Year 120 (actual):  ${GDP_120:,.0f}")
-print(f"    Year 125 (forecast): ${gdp_forecasts_121_125[125]:,.0f}")
-print(f"    5-Year Growth:      {gdp_growth_5yr:+.1f}%")
-print(f"    Annualized:         {annualized:+.1f}%")
-print(f"    Peak Year:          123 (fisher HIGH + mature policies)")
-
-print(f"\n  Happiness:")
-print(f"    Year 120 (actual):  {HAPPINESS_BASELINE_120:.2f}")
-print(f"    Year 125 (forecast): {happiness_forecasts_121_125[125]:.2f}")
-print(f"    5-Year Change:      {happiness_change_5yr:+.2f} points")
-print(f"    Tax relief drives improvement; retirement age 90 creates drag")
-
-print(f"\n  Gini (Inequality):")
-print(f"    Formal: {ACTUAL_GINI_116_120[120]['formal']:.3f} → {gini_formal_121_125[125]:.3f} ({gini_formal_change_5yr:+.3f})")
-print(f"    Full:   {ACTUAL_GINI_116_120[120]['full']:.3f} → {gini_full_121_125[125]:.3f} ({gini_full_change_5yr:+.3f})")
-print(f"    Tax relief for bottom 25% directly reduces formal inequality")
-print(f"    Raiders remain but gap shrinking slowly")
-
-print("\n  Policy Impact Analysis:")
-print("    POSITIVE:")
-print("      - Tax relief bottom 25%: Strongest equality + happiness effect")
-print("      - Dual-income push: Adds productive workforce, modest GDP boost")
-print("      - Retirement 90: Significant GDP boost from larger workforce")
-print("    NEGATIVE:")
-print("      - Retirement 90: Major happiness drag (elderly forced to work)")
-print("      - Reduced tax revenue from bottom 25% relief: limits public spending")
-print("      - Elderly workers at 40-60% productivity: drags avg productivity")
-
-print("\n  Key Risks:")
-print("    - Drought in Year 125 (30% probability, mitigated by drought-resistant crops)")
-print("    - Raiders persist despite security infrastructure")
-print("    - Retirement age 90 may face political resistance")
-print("    - Fisher cycle LOW years (121, 122, 124, 125) depress GDP significantly")
-print("=" * 80)
+out.append(f"\n  GDP:")
+out.append(f"    Year 120 (actual):  ${GDP_120:,.0f}")
+out.append(f"    Year 125 (forecast): ${gdp_forecasts_121_125[125]:,.0f}")
+out.append(f"    5-Year Growth:      {gdp_growth_5yr:+.1f}%")
+out.append(f"    Annualized:         {annualized:+.1f}%")
+out.append(f"    Peak Year:          123 (fisher HIGH + mature policies)")
+
+out.append(f"\n  Happiness:")
+out.append(f"    Year 120 (actual):  {HAPPINESS_BASELINE_120:.2f}")
+out.append(f"    Year 125 (forecast): {happiness_forecasts_121_125[125]:.2f}")
+out.append(f"    5-Year Change:      {happiness_change_5yr:+.2f} points")
+out.append(f"    Tax relief drives improvement; retirement age 90 creates drag")
+
+out.append(f"\n  Gini (Inequality):")
+out.append(f"    Formal: {ACTUAL_GINI_116_120[120]['formal']:.3f} → {gini_formal_121_125[125]:.3f} ({gini_formal_change_5yr:+.3f})")
+out.append(f"    Full:   {ACTUAL_GINI_116_120[120]['full']:.3f} → {gini_full_121_125[125]:.3f} ({gini_full_change_5yr:+.3f})")
+out.append(f"    Tax relief for bottom 25% directly reduces formal inequality")
+out.append(f"    Raiders remain but gap shrinking slowly")
+
+out.append("\n  Policy Impact Analysis:")
+out.append("    POSITIVE:")
+out.append("      - Tax relief bottom 25%: Strongest equality + happiness effect")
+out.append("      - Dual-income push: Adds productive workforce, modest GDP boost")
+out.append("      - Retirement 90: Significant GDP boost from larger workforce")
+out.append("    NEGATIVE:")
+out.append("      - Retirement 90: Major happiness drag (elderly forced to work)")
+out.append("      - Reduced tax revenue from bottom 25% relief: limits public spending")
+out.append("      - Elderly workers at 40-60% productivity: drags avg productivity")
+
+out.append("\n  Key Risks:")
+out.append("    - Drought in Year 125 (30% probability, mitigated by drought-resistant crops)")
+out.append("    - Raiders persist despite security infrastructure")
+out.append("    - Retirement age 90 may face political resistance")
+out.append("    - Fisher cycle LOW years (121, 122, 124, 125) depress GDP significantly")
+out.append("=" * 80)
 
 # =============================================================================
 # COMPACT FORECAST TABLE
 # =============================================================================
-print("\n" + "=" * 80)
-print("COMPACT FORECAST: YEARS 121-125")
-print("=" * 80)
-print(f"  {'Year':<6}{'GDP':>14}{'Happiness':>12}{'Gini Formal':>13}{'Gini Full':>12}{'Fisher':>8}")
-print("  " + "-" * 65)
-print(f"  {'120':<6}{GDP_120:>14,.0f}{HAPPINESS_BASELINE_120:>12.2f}{ACTUAL_GINI_116_120[120]['formal']:>13.3f}{ACTUAL_GINI_116_120[120]['full']:>12.3f}{'HIGH':>8}")
+out.append("\n" + "=" * 80)
+out.append("COMPACT FORECAST: YEARS 121-125")
+out.append("=" * 80)
+out.append(f"  {'Year':<6}{'GDP':>14}{'Happiness':>12}{'Gini Formal':>13}{'Gini Full':>12}{'Fisher':>8}")
+out.append("  " + "-" * 65)
+out.append(f"  {'120':<6}{GDP_120:>14,.0f}{HAPPINESS_BASELINE_120:>12.2f}{ACTUAL_GINI_116_120[120]['formal']:>13.3f}{ACTUAL_GINI_116_120[120]['full']:>12.3f}{'HIGH':>8}")
 for year in range(121, 126):
-    print(f"  {year:<6}{gdp_forecasts_121_125[year]:>14,.0f}{happiness_forecasts_121_125[year]:>12.2f}{gini_formal_121_125[year]:>13.3f}{gini_full_121_125[year]:>12.3f}{FISHER_CYCLE_121_125[year]:>8}")
-print("=" * 80)
+    out.append(f"  {year:<6}{gdp_forecasts_121_125[year]:>14,.0f}{happiness_forecasts_121_125[year]:>12.2f}{gini_formal_121_125[year]:>13.3f}{gini_full_121_125[year]:>12.3f}{FISHER_CYCLE_121_125[year]:>8}")
+out.append("=" * 80)
+
+sys.stdout.write("\n".join(out) + "\n")